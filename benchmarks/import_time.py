@@ -0,0 +1,46 @@
+"""
+Measures how long importing screenplay takes in fresh interpreters,
+with and without loading the Selenium WebDriver interactions.
+
+Run from the repository root: python benchmarks/import_time.py [runs]
+"""
+
+# --------------------------------------------------------------------------------
+# Imports
+# --------------------------------------------------------------------------------
+
+import statistics
+import subprocess
+import sys
+
+
+# --------------------------------------------------------------------------------
+# Globals
+# --------------------------------------------------------------------------------
+
+STATEMENTS = {
+  'import screenplay': 'import screenplay',
+  'import screenplay + webdriver': 'import screenplay; screenplay.Click',
+}
+
+TIMER = 'import time; start = time.perf_counter(); {}; print(time.perf_counter() - start)'
+
+
+# --------------------------------------------------------------------------------
+# Functions
+# --------------------------------------------------------------------------------
+
+def time_import(statement):
+  code = TIMER.format(statement)
+  output = subprocess.run([sys.executable, '-c', code], capture_output=True, check=True, text=True)
+  return float(output.stdout)
+
+
+def main(runs):
+  for label, statement in STATEMENTS.items():
+    times = [time_import(statement) for _ in range(runs)]
+    print(f'{label:32s} median {statistics.median(times) * 1000:7.1f} ms over {runs} runs')
+
+
+if __name__ == '__main__':
+  main(int(sys.argv[1]) if len(sys.argv) > 1 else 10)
@@ -0,0 +1,62 @@
+"""
+A Pythonic Screenplay Pattern.
+
+The core, conditions, waiting, composite and locators modules are imported eagerly
+and have no third-party dependencies. Selenium WebDriver interactions are imported
+on first access (for example, screenplay.Click), so processes that never touch a
+browser never pay Selenium's import cost.
+"""
+
+# --------------------------------------------------------------------------------
+# Imports
+# --------------------------------------------------------------------------------
+
+import importlib
+
+from screenplay.composite import CachedSetup, Gather, Sequence
+from screenplay.conditions import *   # pylint: disable=unused-wildcard-import
+from screenplay.core import Actor, Interaction, LazyAbility, Question, Task
+from screenplay.core import DeadlineExceededException, MissingAbilityException, ScreenplayException
+from screenplay.locators import Locator, LocatorCache
+from screenplay.waiting import WaitUntil, WaitingException
+
+
+# --------------------------------------------------------------------------------
+# Lazy Imports
+# --------------------------------------------------------------------------------
+
+# Names are listed rather than looked up, so that unknown names never import Selenium
+
+LAZY_NAMES = {
+  'screenplay.webdriver': (
+    'AcceptAlert', 'AddCookies', 'AlertPresence', 'AlertText', 'AppearanceOf', 'AppearanceOfAll',
+    'BrowserLogCollector', 'BrowserLogs', 'BrowserState', 'BrowsingContext', 'Clear', 'Click',
+    'CloseWindow', 'Cookies', 'CountOf', 'CssClassesOf', 'CssPropertyValueOf', 'CurrentUrl',
+    'DeleteAllCookies', 'DismissAlert', 'DocumentReadyState', 'EnabledStateOf', 'ExistenceOf',
+    'FillForm', 'HoverOver', 'HtmlAttributeOf', 'JavaScriptErrors', 'JavaScriptInBrowser',
+    'LocationOf', 'LocatorInteraction', 'MaximizeWindow', 'MinimizeWindow', 'NavigateToUrl',
+    'NewTab', 'NewWindowHandles', 'PageIsIdle', 'PageLoadMetrics', 'PageReadiness', 'PixelSizeOf',
+    'PropertyOf', 'QuitBrowser', 'RefreshBrowser', 'RestoreBrowserState', 'RestoreBrowserStateFrom',
+    'SaveBrowserStateAs', 'SaveScreenshotTo', 'ScreenshotAsBase64', 'ScreenshotAsPng', 'ScrollBy',
+    'ScrollTo', 'ScrollToEnd', 'SelectByIndex', 'SelectByText', 'SelectByValue',
+    'SelectInteraction', 'SelectOptionsTextList', 'SelectedOptionsTextList', 'SelectedStateOf',
+    'SeleniumBackend', 'SendKeysTo', 'Submit', 'SwitchToDefaultContent', 'SwitchToFrame',
+    'SwitchToWindow', 'TagNameOf', 'TextListOf', 'TextOf', 'TextStreamOf', 'Title',
+    'ValueAttributeOf', 'WaitForNewWindow', 'WaitUntilDocumentReady', 'WaitUntilPageIsIdle',
+    'WindowHandles', 'WithBrowserLogs', 'browser', 'browsing_context', 'enter_frames',
+    'group_by_frames', 'handle_unexpected_alert', 'page_url', 'profile_script', 'record_lookup',
+    'reset_entered_frames', 'reset_frames', 'window_handles', 'with_alert_policy',
+  ),
+}
+
+
+def __getattr__(name):
+  for module_name, names in LAZY_NAMES.items():
+    if module_name == f'{__name__}.{name}':
+      return importlib.import_module(module_name)
+    if name in names:
+      value = getattr(importlib.import_module(module_name), name)
+      globals()[name] = value
+      return value
+
+  raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
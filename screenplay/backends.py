@@ -0,0 +1,77 @@
+"""
+Contains the browser backend protocol targeted by the WebDriver interactions.
+Implement new backends by creating subclasses of Backend.
+"""
+
+# --------------------------------------------------------------------------------
+# Imports
+# --------------------------------------------------------------------------------
+
+from abc import ABC, abstractmethod
+
+
+# --------------------------------------------------------------------------------
+# Abstract Class: Backend
+# --------------------------------------------------------------------------------
+
+# Interactions use an actor's 'webdriver' ability through this protocol.
+# Raw Selenium drivers are adapted automatically by screenplay.webdriver.SeleniumBackend.
+#
+# Elements returned by a backend follow Selenium's WebElement interface
+# (click, clear, send_keys, text, get_attribute, is_displayed, ...),
+# and failures are reported with Selenium's exception types.
+# Window, frame, alert, cookie and screenshot interactions use the same attribute
+# names as Selenium's WebDriver (switch_to, get_cookies, save_screenshot, ...),
+# so backends that lack a capability simply do not support those interactions.
+
+class Backend(ABC):
+
+  @abstractmethod
+  def find_element(self, qtype, query):
+    pass
+
+  @abstractmethod
+  def find_elements(self, qtype, query):
+    pass
+
+  @abstractmethod
+  def execute_script(self, script, *args):
+    pass
+
+  @abstractmethod
+  def get(self, url):
+    pass
+
+  @abstractmethod
+  def refresh(self):
+    pass
+
+  @property
+  @abstractmethod
+  def current_url(self):
+    pass
+
+  @property
+  @abstractmethod
+  def title(self):
+    pass
+
+  @abstractmethod
+  def hover(self, element):
+    pass
+
+  @abstractmethod
+  def pointer_click(self, element):
+    pass
+
+  @abstractmethod
+  def type_into(self, elements_and_keys):
+    pass
+
+  @abstractmethod
+  def select(self, element):
+    pass
+
+  @abstractmethod
+  def quit(self):
+    pass
@@ -0,0 +1,117 @@
+"""
+Contains support for caches persisted to disk between runs.
+"""
+
+# --------------------------------------------------------------------------------
+# Imports
+# --------------------------------------------------------------------------------
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+
+
+# --------------------------------------------------------------------------------
+# Logging
+# --------------------------------------------------------------------------------
+
+logger = logging.getLogger(__name__)
+
+
+# --------------------------------------------------------------------------------
+# Class: JsonFileCache
+# --------------------------------------------------------------------------------
+
+# Several processes may share a cache file. Saving merges this instance's changes
+# into the file's latest contents, so that writers do not drop each other's entries.
+
+class JsonFileCache:
+
+  def __init__(self, path):
+    self.path = path
+    self._lock = threading.RLock()
+    self._changed = dict()
+    self._deleted = set()
+    self._data = self._load()
+
+  def _load(self):
+    try:
+      with open(self.path) as cache_file:
+        return json.load(cache_file)
+    except FileNotFoundError:
+      return dict()
+    except ValueError:
+      logger.warning(f'Ignoring the unreadable cache file "{self.path}"')
+      return dict()
+
+  def get(self, key, default=None):
+    with self._lock:
+      return self._data.get(key, default)
+
+  def set(self, key, value):
+    with self._lock:
+      self._data[key] = value
+      self._changed[key] = value
+      self._deleted.discard(key)
+
+  def delete(self, key):
+    with self._lock:
+      if self._data.pop(key, None) is not None:
+        self._changed.pop(key, None)
+        self._deleted.add(key)
+
+  def save(self):
+    with self._lock:
+      if not self._changed and not self._deleted:
+        return
+      data = self._load()
+      data.update(self._changed)
+      for key in self._deleted:
+        data.pop(key, None)
+
+      # write a uniquely named temporary file first so readers never see a partial cache
+      directory = os.path.dirname(os.path.abspath(self.path))
+      handle, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+      try:
+        with os.fdopen(handle, 'w') as cache_file:
+          json.dump(data, cache_file, indent=2, sort_keys=True)
+        os.replace(temp_path, self.path)
+      except BaseException:
+        os.remove(temp_path)
+        raise
+
+      self._data = data
+      self._changed.clear()
+      self._deleted.clear()
+    logger.debug(f'Saved the cache file "{self.path}"')
+
+  def __contains__(self, key):
+    with self._lock:
+      return key in self._data
+
+  def __len__(self):
+    with self._lock:
+      return len(self._data)
+
+
+# --------------------------------------------------------------------------------
+# Class: ExpiringJsonFileCache
+# --------------------------------------------------------------------------------
+
+class ExpiringJsonFileCache(JsonFileCache):
+
+  def store(self, key, value):
+    self.set(key, dict(stored=time.time(), value=value))
+
+  def fetch(self, key, max_age=None):
+    entry = self.get(key)
+    if entry is None:
+      return None
+    if max_age is not None and time.time() - entry['stored'] > max_age:
+      logger.debug(f'The cached entry "{key}" in "{self.path}" expired')
+      self.delete(key)
+      return None
+    return entry['value']
@@ -0,0 +1,109 @@
+"""
+Contains interactions composed of other interactions.
+"""
+
+# --------------------------------------------------------------------------------
+# Imports
+# --------------------------------------------------------------------------------
+
+import json
+import logging
+
+from concurrent.futures import ThreadPoolExecutor
+from screenplay.core import Question, Task
+
+
+# --------------------------------------------------------------------------------
+# Logging
+# --------------------------------------------------------------------------------
+
+logger = logging.getLogger(__name__)
+
+
+# --------------------------------------------------------------------------------
+# Task: Sequence
+# --------------------------------------------------------------------------------
+
+class Sequence(Task):
+
+  def __init__(self, *interactions):
+    self.interactions = interactions
+
+  def perform_as(self, actor):
+    return [actor.calls(i) for i in self.interactions]
+
+  def __str__(self):
+    return f'do in sequence: {", ".join(str(i) for i in self.interactions)}'
+
+
+# --------------------------------------------------------------------------------
+# Question: Gather
+# --------------------------------------------------------------------------------
+
+# Asks independent questions concurrently and answers with a list in the same order.
+# Questions sharing one ability should use a thread-safe actor: Actor(thread_safe=True).
+
+class Gather(Question):
+
+  def __init__(self, *questions, max_workers=None):
+    self.questions = questions
+    self.max_workers = max_workers
+
+  def request_as(self, actor):
+    if len(self.questions) < 2:
+      return [actor.asks_for(q) for q in self.questions]
+
+    # worker threads share the caller's time budget
+    deadline = getattr(actor.local, 'deadline', None)
+    workers = self.max_workers or len(self.questions)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+      futures = [pool.submit(self._ask, actor, q, deadline) for q in self.questions]
+      return [f.result() for f in futures]
+
+  def _ask(self, actor, question, deadline):
+    actor.local.deadline = deadline
+    try:
+      return actor.asks_for(question)
+    finally:
+      actor.local.deadline = None
+
+  def __str__(self):
+    return f'all of: {", ".join(str(q) for q in self.questions)}'
+
+
+# --------------------------------------------------------------------------------
+# Task: CachedSetup
+# --------------------------------------------------------------------------------
+
+# Performs an idempotent setup task only when the state it leaves behind is missing.
+# After performing the task, the answer to the fingerprint question is stored under the key
+# in the actor's 'setup_cache' ability, an ExpiringJsonFileCache saved between runs.
+# Later scenarios skip the task while the fingerprint still matches and is younger than max_age.
+# Answers True if the task was performed and False if it was skipped.
+
+class CachedSetup(Task):
+
+  def __init__(self, task, key, fingerprint, max_age=None):
+    self.task = task
+    self.key = key
+    self.fingerprint = fingerprint
+    self.max_age = max_age
+
+  def _fingerprint(self, actor):
+    # compare answers the way they look once stored as JSON
+    return json.loads(json.dumps(actor.asks_for(self.fingerprint)))
+
+  def perform_as(self, actor):
+    cache = actor.using('setup_cache')
+    recorded = cache.fetch(self.key, self.max_age)
+    if recorded is not None and recorded == self._fingerprint(actor):
+      logger.info(f'{actor} skips {self.task} because its setup "{self.key}" is in place')
+      return False
+
+    actor.attempts_to(self.task)
+    cache.store(self.key, self._fingerprint(actor))
+    cache.save()
+    return True
+
+  def __str__(self):
+    return f'set up "{self.key}" with {self.task}'
@@ -7,7 +7,24 @@ Implement new conditions by creating subclasses of Condition.
 # Imports
 # --------------------------------------------------------------------------------
 
+import operator
+import re
+
 from abc import ABC, abstractmethod
+from itertools import islice
+
+
+# --------------------------------------------------------------------------------
+# Exports
+# --------------------------------------------------------------------------------
+
+__all__ = [
+  'Condition', 'ValueCondition',
+  'IsEqualTo', 'IsNotEqualTo', 'IsTrue', 'IsFalse',
+  'IsGreaterThan', 'IsGreaterThanOrEqualTo', 'IsLessThan', 'IsLessThanOrEqualTo',
+  'Contains', 'DoesNotContain',
+  'AllSatisfy', 'AnySatisfy', 'CountSatisfying', 'IsSorted', 'MatchesRegexAll',
+]
 
 
 # --------------------------------------------------------------------------------
@@ -109,3 +126,121 @@ class DoesNotContain(ValueCondition):
     return self.value not in actual
   def __str__(self):
     return f'does not contain {self.value}'
+
+
+# --------------------------------------------------------------------------------
+# Vectorized Evaluation
+# --------------------------------------------------------------------------------
+
+# Numerical comparisons over flat numeric lists at least this long are evaluated
+# with NumPy in one pass, if NumPy is installed.
+# NumPy is imported only when the first such list is evaluated, to keep imports fast
+VECTORIZE_THRESHOLD = 1000
+
+numpy = None
+
+NUMPY_OPERATORS = {
+  IsEqualTo: operator.eq,
+  IsNotEqualTo: operator.ne,
+  IsGreaterThan: operator.gt,
+  IsGreaterThanOrEqualTo: operator.ge,
+  IsLessThan: operator.lt,
+  IsLessThanOrEqualTo: operator.le,
+}
+
+
+def load_numpy():
+  # answers the numpy module, or False if it is not installed
+  global numpy
+  if numpy is None:
+    try:
+      import numpy as module
+    except ImportError:
+      module = False
+    numpy = module
+  return numpy
+
+
+def vectorize(condition, actual):
+  # answers an array of booleans, or None when the condition cannot be vectorized
+  op = NUMPY_OPERATORS.get(type(condition))
+  if op is None or not hasattr(actual, '__len__') or len(actual) < VECTORIZE_THRESHOLD:
+    return None
+  np = load_numpy()
+  if not np:
+    return None
+  try:
+    values = np.asarray(actual)
+  except ValueError:
+    # ragged nested lists
+    return None
+  # nested lists and list values would be compared element by element
+  if values.ndim != 1 or np.ndim(condition.value) != 0 or values.dtype.kind not in 'iuf':
+    return None
+  return op(values, condition.value)
+
+
+# --------------------------------------------------------------------------------
+# Conditions for Collections
+# --------------------------------------------------------------------------------
+
+class AllSatisfy(Condition):
+  def __init__(self, condition):
+    self.condition = condition
+  def evaluate(self, actual):
+    results = vectorize(self.condition, actual)
+    if results is not None:
+      return bool(results.all())
+    return all(self.condition.evaluate(a) for a in actual)
+  def __str__(self):
+    return f'all {self.condition}'
+
+
+class AnySatisfy(Condition):
+  def __init__(self, condition):
+    self.condition = condition
+  def evaluate(self, actual):
+    results = vectorize(self.condition, actual)
+    if results is not None:
+      return bool(results.any())
+    return any(self.condition.evaluate(a) for a in actual)
+  def __str__(self):
+    return f'any {self.condition}'
+
+
+class CountSatisfying(Condition):
+  def __init__(self, condition, count_condition):
+    self.condition = condition
+    self.count_condition = count_condition
+  def evaluate(self, actual):
+    results = vectorize(self.condition, actual)
+    if results is not None:
+      count = int(results.sum())
+    else:
+      count = sum(1 for a in actual if self.condition.evaluate(a))
+    return self.count_condition.evaluate(count)
+  def __str__(self):
+    return f'count of items that {self.condition} {self.count_condition}'
+
+
+class IsSorted(Condition):
+  def __init__(self, reverse=False, key=None):
+    self.reverse = reverse
+    self.key = key
+  def evaluate(self, actual):
+    # answers may be iterators, which cannot be paired with themselves
+    items = list(actual) if self.key is None else [self.key(a) for a in actual]
+    compare = operator.ge if self.reverse else operator.le
+    return all(compare(a, b) for a, b in zip(items, islice(items, 1, None)))
+  def __str__(self):
+    return 'is sorted in reverse' if self.reverse else 'is sorted'
+
+
+class MatchesRegexAll(Condition):
+  def __init__(self, pattern, flags=0):
+    self.regex = re.compile(pattern, flags)
+  def evaluate(self, actual):
+    search = self.regex.search
+    return all(search(a) is not None for a in actual)
+  def __str__(self):
+    return f'all match "{self.regex.pattern}"'
@@ -6,9 +6,13 @@ Contains the core definitions for the Screenplay Pattern.
 # Imports
 # --------------------------------------------------------------------------------
 
+import inspect
 import logging
+import threading
+import time
 
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 
 
 # --------------------------------------------------------------------------------
@@ -18,18 +22,33 @@ from abc import ABC, abstractmethod
 logger = logging.getLogger(__name__)
 
 
+# --------------------------------------------------------------------------------
+# Immutable Types
+# --------------------------------------------------------------------------------
+
+# Abilities of these types are shared across threads without locking
+IMMUTABLE_TYPES = (str, bytes, int, float, complex, bool, tuple, frozenset, type(None))
+
+
 # --------------------------------------------------------------------------------
 # Class: Actor
 # --------------------------------------------------------------------------------
 
 class Actor:
 
-  def __init__(self, name='Actor'):
+  def __init__(self, name='Actor', thread_safe=False):
     self.name = name
+    self.thread_safe = thread_safe
+    self.local = threading.local()
     self._abilities = dict()
+    self._ability_locks = dict()
+    self._lock = threading.RLock()
 
   def can_use(self, **kwargs):
-    self._abilities.update(kwargs)
+    with self._lock:
+      self._abilities.update(kwargs)
+      for name in kwargs:
+        self._ability_locks.setdefault(name, threading.RLock())
     logger.debug(f'{self} can use: {kwargs}')
 
   def has(self, ability):
@@ -39,22 +58,82 @@ class Actor:
     if not self.has(ability):
       raise MissingAbilityException(self, ability)
     value = self._abilities[ability]
+    if isinstance(value, LazyAbility):
+      if not value.resolved:
+        logger.debug(f'{self} is constructing "{ability}"')
+      value = value.resolve()
     logger.debug(f'{self} is using "{ability}" as "{value}"')
+    if self.thread_safe and not isinstance(value, IMMUTABLE_TYPES):
+      value = SynchronizedAbility(value, self._ability_locks[ability])
     return value
 
+  @contextmanager
+  def exclusively(self, ability):
+    value = self.using(ability)
+    if isinstance(value, SynchronizedAbility):
+      with value._lock:
+        yield value._value
+    else:
+      yield value
+
+  @property
+  def ability_timings(self):
+    return {name: ability.construction_time
+      for name, ability in self._abilities.items()
+      if isinstance(ability, LazyAbility) and ability.resolved}
+
+  def exit(self):
+    with self._lock:
+      lazy = [(n, a) for n, a in self._abilities.items() if isinstance(a, LazyAbility)]
+    for name, ability in reversed(lazy):
+      try:
+        ability.close()
+      except Exception:
+        logger.exception(f'{self} failed to tear down "{name}"')
+    logger.debug(f'{self} exited')
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, exc_type, exc_value, traceback):
+    self.exit()
+
+  @contextmanager
+  def within(self, seconds):
+    # nested budgets can only shorten the deadline of the budget around them
+    outer = getattr(self.local, 'deadline', None)
+    deadline = time.monotonic() + seconds
+    self.local.deadline = deadline if outer is None else min(outer, deadline)
+    try:
+      yield
+    finally:
+      self.local.deadline = outer
+
+  def remaining_time(self):
+    deadline = getattr(self.local, 'deadline', None)
+    return None if deadline is None else deadline - time.monotonic()
+
+  def _check_deadline(self, interaction):
+    remaining = self.remaining_time()
+    if remaining is not None and remaining <= 0:
+      raise DeadlineExceededException(self, interaction)
+
   def attempts_to(self, task):
+    self._check_deadline(task)
     logger.info(f'{self} attempts to {task}')
     answer = task.perform_as(self)
     logger.info(f'{self} did {task}')
     return answer
 
   def asks_for(self, question):
+    self._check_deadline(question)
     logger.info(f'{self} asks for {question}')
     answer = question.request_as(self)
     logger.info(f'{self} asked for {question} and got {answer}')
     return answer
 
   def calls(self, interaction):
+    self._check_deadline(interaction)
     logger.info(f'{self} calls {interaction}')
     if isinstance(interaction, Task):
       answer = interaction.perform_as(self)
@@ -70,6 +149,108 @@ class Actor:
     return self.name
 
 
+# --------------------------------------------------------------------------------
+# Class: LazyAbility
+# --------------------------------------------------------------------------------
+
+class LazyAbility:
+
+  def __init__(self, factory, teardown=None):
+    self.factory = factory
+    self.teardown = teardown
+    self.construction_time = None
+    self._value = None
+    self._resolved = False
+    self._closed = False
+    self._lock = threading.Lock()
+
+  @property
+  def resolved(self):
+    return self._resolved
+
+  def resolve(self):
+    # double-checked locking keeps resolved reads lock-free
+    if not self._resolved:
+      with self._lock:
+        # teardowns that use other abilities must not bring closed ones back to life
+        if self._closed:
+          raise ScreenplayException(f'The {self} was closed and cannot be used again')
+        if not self._resolved:
+          start = time.monotonic()
+          self._value = self.factory()
+          self.construction_time = time.monotonic() - start
+          self._resolved = True
+    return self._value
+
+  def close(self):
+    with self._lock:
+      self._closed = True
+      if not self._resolved:
+        return
+      value = self._value
+      self._value = None
+      self._resolved = False
+    if self.teardown:
+      self.teardown(value)
+
+  def __str__(self):
+    return f'lazy ability from {self.factory}'
+
+
+# --------------------------------------------------------------------------------
+# Class: SynchronizedAbility
+# --------------------------------------------------------------------------------
+
+# Serializes each call on a mutable ability with a lock shared by every thread.
+# Objects the ability hands out, like a driver's elements or its switch_to,
+# are wrapped with the same lock, while builtin values like dicts are returned as they are.
+# Each call is serialized on its own: hold the lock for a sequence of calls with Actor.exclusively.
+
+class SynchronizedAbility:
+
+  def __init__(self, value, lock):
+    object.__setattr__(self, '_value', value)
+    object.__setattr__(self, '_lock', lock)
+
+  def _synchronize(self, value):
+    if isinstance(value, list):
+      return [self._synchronize(v) for v in value]
+    if isinstance(value, IMMUTABLE_TYPES) or type(value).__module__ == 'builtins':
+      return value
+    return SynchronizedAbility(value, self._lock)
+
+  def __getattr__(self, name):
+    with self._lock:
+      attr = getattr(self._value, name)
+    if not inspect.isroutine(attr):
+      return self._synchronize(attr)
+
+    def synchronized(*args, **kwargs):
+      with self._lock:
+        return self._synchronize(attr(*args, **kwargs))
+    return synchronized
+
+  def __setattr__(self, name, value):
+    with self._lock:
+      setattr(self._value, name, value)
+
+  @property
+  def __class__(self):
+    # keeps isinstance checks against the wrapped value working
+    return self._value.__class__
+
+  def __eq__(self, other):
+    if isinstance(other, SynchronizedAbility):
+      other = other._value
+    return self._value == other
+
+  def __hash__(self):
+    return hash(self._value)
+
+  def __str__(self):
+    return str(self._value)
+
+
 # --------------------------------------------------------------------------------
 # Abstract Class: Interaction
 # --------------------------------------------------------------------------------
@@ -116,3 +297,21 @@ class MissingAbilityException(ScreenplayException):
     super().__init__(f'The actor "{actor}" does not have an ability named "{ability}"')
     self.actor = actor
     self.ability = ability
+
+  def __reduce__(self):
+    # actors cannot be pickled, so only their names cross processes
+    return (type(self), (str(self.actor), self.ability))
+
+
+# --------------------------------------------------------------------------------
+# Class: DeadlineExceededException
+# --------------------------------------------------------------------------------
+
+class DeadlineExceededException(ScreenplayException):
+  def __init__(self, actor, interaction):
+    super().__init__(f'The actor "{actor}" ran out of time budget before finishing "{interaction}"')
+    self.actor = actor
+    self.interaction = interaction
+
+  def __reduce__(self):
+    return (type(self), (str(self.actor), self.interaction))
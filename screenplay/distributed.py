@@ -0,0 +1,196 @@
+"""
+Contains support for running interactions on actors in other processes or on other hosts.
+Start workers with serve, then dispatch interactions to them with RemoteActor or dispatch.
+Interactions and their answers are pickled, so they must not hold lambdas, drivers or elements.
+"""
+
+# --------------------------------------------------------------------------------
+# Imports
+# --------------------------------------------------------------------------------
+
+import logging
+import pickle
+import queue
+import threading
+import time
+import traceback
+
+from multiprocessing.connection import Client, Listener
+from screenplay.core import ScreenplayException
+
+
+# --------------------------------------------------------------------------------
+# Logging
+# --------------------------------------------------------------------------------
+
+logger = logging.getLogger(__name__)
+
+
+# --------------------------------------------------------------------------------
+# Constants
+# --------------------------------------------------------------------------------
+
+METHODS = ('attempts_to', 'asks_for', 'calls')
+
+
+# --------------------------------------------------------------------------------
+# Worker
+# --------------------------------------------------------------------------------
+
+# Each connection gets its own actor from actor_factory, with its own abilities (like a webdriver),
+# and the actor exits when the coordinator disconnects.
+# Addresses are (host, port) pairs or Unix socket paths, as for multiprocessing.connection.
+# Serves forever unless a number of connections is given.
+
+def serve(address, actor_factory, authkey, connections=None):
+  threads = []
+  with Listener(address, authkey=authkey) as listener:
+    logger.info(f'Serving actors at {listener.address}')
+    while connections is None or len(threads) < connections:
+      connection = listener.accept()
+      thread = threading.Thread(target=_serve_connection, args=(connection, actor_factory), daemon=True)
+      thread.start()
+      threads.append(thread)
+  for thread in threads:
+    thread.join()
+
+
+def _serve_connection(connection, actor_factory):
+  with connection, actor_factory() as actor:
+    while True:
+      try:
+        method, interaction = connection.recv()
+      except EOFError:
+        return
+      _send(connection, *_perform(actor, method, interaction))
+
+
+def _perform(actor, method, interaction):
+  start = time.monotonic()
+  try:
+    if method not in METHODS:
+      raise ScreenplayException(f'Remote actors cannot use the method "{method}"')
+    answer = getattr(actor, method)(interaction)
+    return 'answer', answer, time.monotonic() - start
+  except Exception as e:
+    logger.exception(f'{actor} failed to {method} {interaction}')
+    return 'error', e, time.monotonic() - start
+
+
+def _send(connection, kind, value, duration):
+  if kind == 'error':
+    value = _portable(value)
+  # connections pickle a message completely before writing it
+  try:
+    connection.send((kind, value, duration))
+  except (pickle.PicklingError, TypeError, AttributeError) as e:
+    connection.send(('error', RemoteException(f'The answer cannot be returned: {e}'), duration))
+
+
+def _portable(error):
+  # exceptions with extra constructor arguments and no __reduce__ cannot cross processes
+  try:
+    pickle.loads(pickle.dumps(error))
+    return error
+  except Exception:
+    details = ''.join(traceback.format_exception(type(error), error, error.__traceback__))
+    return RemoteException(f'{type(error).__name__}: {error}', details)
+
+
+# --------------------------------------------------------------------------------
+# Class: RemoteActor
+# --------------------------------------------------------------------------------
+
+class RemoteActor:
+
+  def __init__(self, address, authkey, name=None, connect_timeout=10):
+    self.address = address
+    self.name = name or f'Remote actor at {address}'
+    self.timings = []
+    self._lock = threading.Lock()
+    self._connection = self._connect(authkey, connect_timeout)
+
+  def _connect(self, authkey, connect_timeout):
+    # workers may still be starting
+    end = time.monotonic() + connect_timeout
+    while True:
+      try:
+        return Client(self.address, authkey=authkey)
+      except (ConnectionRefusedError, FileNotFoundError):
+        if time.monotonic() >= end:
+          raise
+        time.sleep(0.05)
+
+  def _request(self, method, interaction):
+    logger.info(f'{self} {method} {interaction}')
+    with self._lock:
+      self._connection.send((method, interaction))
+      kind, value, duration = self._connection.recv()
+      self.timings.append((str(interaction), duration))
+    if kind == 'error':
+      raise value
+    return value
+
+  def attempts_to(self, task):
+    return self._request('attempts_to', task)
+
+  def asks_for(self, question):
+    return self._request('asks_for', question)
+
+  def calls(self, interaction):
+    return self._request('calls', interaction)
+
+  def close(self):
+    self._connection.close()
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, exc_type, exc_value, traceback):
+    self.close()
+
+  def __str__(self):
+    return self.name
+
+
+# --------------------------------------------------------------------------------
+# Dispatch
+# --------------------------------------------------------------------------------
+
+# Calls interactions on whichever remote actor is free next, from a shared work queue,
+# and answers with their results in the same order.
+# Failures are returned in place of answers so that one failure does not hide the others.
+
+def dispatch(interactions, actors):
+  work = queue.Queue()
+  for index, interaction in enumerate(interactions):
+    work.put((index, interaction))
+  results = [None] * len(interactions)
+
+  def work_as(actor):
+    while True:
+      try:
+        index, interaction = work.get_nowait()
+      except queue.Empty:
+        return
+      try:
+        results[index] = actor.calls(interaction)
+      except Exception as e:
+        results[index] = e
+
+  threads = [threading.Thread(target=work_as, args=(actor,)) for actor in actors]
+  for thread in threads:
+    thread.start()
+  for thread in threads:
+    thread.join()
+  return results
+
+
+# --------------------------------------------------------------------------------
+# Class: RemoteException
+# --------------------------------------------------------------------------------
+
+class RemoteException(ScreenplayException):
+  def __init__(self, message, details=None):
+    super().__init__(message)
+    self.details = details
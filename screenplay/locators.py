@@ -0,0 +1,105 @@
+"""
+Contains locators for finding web elements.
+"""
+
+# --------------------------------------------------------------------------------
+# Imports
+# --------------------------------------------------------------------------------
+
+from screenplay.caching import JsonFileCache
+from urllib.parse import urlsplit
+
+
+# --------------------------------------------------------------------------------
+# Locator Types
+# --------------------------------------------------------------------------------
+
+# A list of CSS selectors: the first is matched in the document, and each next one
+# inside the shadow roots of the previous matches. Resolved in a single script.
+SHADOW_PATH = 'shadow path'
+
+
+# --------------------------------------------------------------------------------
+# Class: Locator
+# --------------------------------------------------------------------------------
+
+class Locator:
+
+  def __init__(self, name, qtype, query, fallbacks=(), frame=None):
+    self.name = name
+    self.qtype = qtype
+    self.query = query
+    self.fallbacks = tuple(tuple(f) for f in fallbacks)
+    self.frame = frame
+
+  @property
+  def strategies(self):
+    return ((self.qtype, self.query),) + self.fallbacks
+
+  @property
+  def frame_path(self):
+    # the frame locators to enter from the top-level document, outermost first
+    if self.frame is None:
+      return ()
+    return self.frame.frame_path + (self.frame,)
+
+  def __str__(self):
+    return self.name
+
+  def __repr__(self):
+    return f"{self.qtype}: {self.query}"
+
+
+# --------------------------------------------------------------------------------
+# Class: ShadowLocator
+# --------------------------------------------------------------------------------
+
+class ShadowLocator(Locator):
+
+  def __init__(self, name, *selectors, fallbacks=(), frame=None):
+    super().__init__(name, SHADOW_PATH, tuple(selectors), fallbacks, frame)
+
+  def __repr__(self):
+    return f"{self.qtype}: {' >>> '.join(self.query)}"
+
+
+# --------------------------------------------------------------------------------
+# Class: LocatorCache
+# --------------------------------------------------------------------------------
+
+# Remembers which strategies resolved each locator on each page and how fast.
+# Entries are keyed by page URL (without query or fragment) and locator name,
+# and map each known-good strategy to its latest resolution latency in seconds.
+# Give it to an actor as the 'locator_cache' ability and save it when the actor exits:
+#
+#   actor.can_use(locator_cache=LazyAbility(lambda: LocatorCache(path), teardown=LocatorCache.save))
+
+class LocatorCache(JsonFileCache):
+
+  def _key(self, page, locator):
+    page = urlsplit(page)._replace(query='', fragment='').geturl()
+    return f'{page} {locator.name}'
+
+  def _strategy_key(self, strategy):
+    return f'{strategy[0]}: {strategy[1]}'
+
+  def order(self, page, locator):
+    known = self.get(self._key(page, locator), dict())
+    strategies = locator.strategies
+    good = [s for s in strategies if self._strategy_key(s) in known]
+    good.sort(key=lambda s: known[self._strategy_key(s)])
+    return good + [s for s in strategies if s not in good]
+
+  def record_success(self, page, locator, strategy, latency):
+    with self._lock:
+      key = self._key(page, locator)
+      known = dict(self.get(key, dict()))
+      known[self._strategy_key(strategy)] = latency
+      self.set(key, known)
+
+  def record_failure(self, page, locator, strategy):
+    with self._lock:
+      key = self._key(page, locator)
+      known = dict(self.get(key, dict()))
+      if known.pop(self._strategy_key(strategy), None) is not None:
+        self.set(key, known)
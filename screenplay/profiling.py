@@ -0,0 +1,146 @@
+"""
+Contains support for profiling interactions.
+"""
+
+# --------------------------------------------------------------------------------
+# Imports
+# --------------------------------------------------------------------------------
+
+import math
+import threading
+
+
+# --------------------------------------------------------------------------------
+# Function: percentile
+# --------------------------------------------------------------------------------
+
+def percentile(values, fraction):
+  # nearest-rank percentile of a sorted list
+  if not values:
+    return None
+  rank = max(math.ceil(fraction * len(values)), 1)
+  return values[rank - 1]
+
+
+# --------------------------------------------------------------------------------
+# Class: TimingStats
+# --------------------------------------------------------------------------------
+
+class TimingStats:
+
+  def __init__(self):
+    self.durations = []
+
+  def add(self, duration):
+    self.durations.append(duration)
+
+  @property
+  def count(self):
+    return len(self.durations)
+
+  @property
+  def total(self):
+    return sum(self.durations)
+
+  def summary(self):
+    ordered = sorted(self.durations)
+    return {
+      'count': len(ordered),
+      'total': sum(ordered),
+      'p50': percentile(ordered, 0.50),
+      'p95': percentile(ordered, 0.95),
+      'max': ordered[-1] if ordered else None,
+    }
+
+
+# --------------------------------------------------------------------------------
+# Class: Instrumentation
+# --------------------------------------------------------------------------------
+
+# Give an actor this ability as 'instrumentation' to aggregate measurements by name.
+# Interactions record into it only when the actor has it.
+
+class Instrumentation:
+
+  def __init__(self):
+    self._measurements = dict()
+    self._counters = dict()
+    self._lock = threading.Lock()
+
+  def record(self, metric, value):
+    with self._lock:
+      self._measurements.setdefault(metric, TimingStats()).add(value)
+
+  def count(self, metric, amount=1):
+    with self._lock:
+      self._counters[metric] = self._counters.get(metric, 0) + amount
+
+  def counter(self, metric):
+    with self._lock:
+      return self._counters.get(metric, 0)
+
+  def summary(self):
+    with self._lock:
+      measurements = {m: s.summary() for m, s in self._measurements.items()}
+      return dict(measurements=measurements, counters=dict(self._counters))
+
+  def reset(self):
+    with self._lock:
+      self._measurements.clear()
+      self._counters.clear()
+
+
+# --------------------------------------------------------------------------------
+# Class: LocatorProfiler
+# --------------------------------------------------------------------------------
+
+# Give an actor this ability as 'locator_profiler' to time every element lookup.
+# Lookups made while the actor is inside a WaitUntil are counted as polls.
+
+class LocatorProfiler:
+
+  def __init__(self, slow_threshold=0.5):
+    self.slow_threshold = slow_threshold
+    self._timings = dict()
+    self._polls = dict()
+    self._lock = threading.Lock()
+
+  def record(self, locator, strategy, duration, polled=False):
+    # shadow paths are sequences of selectors
+    query = strategy[1] if isinstance(strategy[1], str) else tuple(strategy[1])
+    key = (locator.name, strategy[0], query)
+    with self._lock:
+      self._timings.setdefault(key, TimingStats()).add(duration)
+      if polled:
+        self._polls[key] = self._polls.get(key, 0) + 1
+
+  def report(self):
+    with self._lock:
+      rows = []
+      for (name, qtype, query), stats in self._timings.items():
+        row = dict(name=name, qtype=qtype, query=query, **stats.summary())
+        row['polls'] = self._polls.get((name, qtype, query), 0)
+        row['slow'] = row['p95'] >= self.slow_threshold
+        row['xpath'] = qtype == 'xpath'
+        rows.append(row)
+    rows.sort(key=lambda r: r['total'], reverse=True)
+    return rows
+
+  def most_polled(self, limit=10):
+    rows = [r for r in self.report() if r['polls'] > 0]
+    rows.sort(key=lambda r: r['polls'], reverse=True)
+    return rows[:limit]
+
+  def format_report(self):
+    lines = ['calls  polls     p50     p95     max   total  flags       locator']
+    for r in self.report():
+      flags = ' '.join(f for f in ('SLOW' if r['slow'] else '', 'XPATH' if r['xpath'] else '') if f)
+      lines.append(
+        f"{r['count']:5d}  {r['polls']:5d}  {r['p50']:6.3f}  {r['p95']:6.3f}  "
+        f"{r['max']:6.3f}  {r['total']:6.2f}  {flags:10s}  {r['name']} ({r['qtype']}: {r['query']})")
+    return '\n'.join(lines)
+
+  def reset(self):
+    with self._lock:
+      self._timings.clear()
+      self._polls.clear()
@@ -0,0 +1,159 @@
+"""
+Contains interactions for REST APIs.
+Give an actor a 'rest_api' ability (RestApi) to call an API over pooled keep-alive connections.
+"""
+
+# --------------------------------------------------------------------------------
+# Imports
+# --------------------------------------------------------------------------------
+
+import json
+import urllib3
+
+from screenplay.core import Question, Task
+from urllib.parse import urlencode
+
+
+# --------------------------------------------------------------------------------
+# Class: Response
+# --------------------------------------------------------------------------------
+
+class Response:
+
+  def __init__(self, status, headers, body):
+    self.status = status
+    self.headers = headers
+    self.body = body
+
+  def json(self):
+    return json.loads(self.body.decode('utf-8'))
+
+  def __str__(self):
+    return f'HTTP {self.status}'
+
+
+# --------------------------------------------------------------------------------
+# Class: RestApi
+# --------------------------------------------------------------------------------
+
+class RestApi:
+
+  def __init__(self, base_url, headers=None, timeout=30, maxsize=10):
+    self.base_url = base_url.rstrip('/')
+    self.headers = dict(headers or {})
+    self._pool = urllib3.PoolManager(maxsize=maxsize, timeout=timeout, retries=False)
+
+  def request(self, method, path, json_body=None, params=None, headers=None):
+    url = self.base_url + path
+    if params:
+      url += '?' + urlencode(params)
+
+    all_headers = dict(self.headers)
+    body = None
+    if json_body is not None:
+      body = json.dumps(json_body).encode('utf-8')
+      all_headers['Content-Type'] = 'application/json'
+    all_headers.update(headers or {})
+
+    response = self._pool.request(method, url, body=body, headers=all_headers)
+    return Response(response.status, dict(response.headers), response.data)
+
+  def close(self):
+    self._pool.clear()
+
+  def __str__(self):
+    return f'REST API at {self.base_url}'
+
+
+# --------------------------------------------------------------------------------
+# Abstract Class: Request
+# --------------------------------------------------------------------------------
+
+class Request(Task):
+
+  method = None
+
+  def __init__(self, path, json_body=None, params=None, headers=None):
+    self.path = path
+    self.json_body = json_body
+    self.params = params
+    self.headers = headers
+
+  def perform_as(self, actor):
+    api = actor.using('rest_api')
+    return api.request(self.method, self.path, self.json_body, self.params, self.headers)
+
+  def __str__(self):
+    return f'{self.method} {self.path}'
+
+
+# --------------------------------------------------------------------------------
+# Task: Delete
+# --------------------------------------------------------------------------------
+
+class Delete(Request):
+  method = 'DELETE'
+
+
+# --------------------------------------------------------------------------------
+# Task: Get
+# --------------------------------------------------------------------------------
+
+class Get(Request):
+  method = 'GET'
+
+
+# --------------------------------------------------------------------------------
+# Task: Patch
+# --------------------------------------------------------------------------------
+
+class Patch(Request):
+  method = 'PATCH'
+
+
+# --------------------------------------------------------------------------------
+# Task: Post
+# --------------------------------------------------------------------------------
+
+class Post(Request):
+  method = 'POST'
+
+
+# --------------------------------------------------------------------------------
+# Task: Put
+# --------------------------------------------------------------------------------
+
+class Put(Request):
+  method = 'PUT'
+
+
+# --------------------------------------------------------------------------------
+# Question: ResponseJson
+# --------------------------------------------------------------------------------
+
+class ResponseJson(Question):
+
+  def __init__(self, request):
+    self.request = request
+
+  def request_as(self, actor):
+    return actor.attempts_to(self.request).json()
+
+  def __str__(self):
+    return f'JSON response of {self.request}'
+
+
+# --------------------------------------------------------------------------------
+# Question: StatusCode
+# --------------------------------------------------------------------------------
+
+class StatusCode(Question):
+
+  def __init__(self, request):
+    self.request = request
+
+  def request_as(self, actor):
+    return actor.attempts_to(self.request).status
+
+  def __str__(self):
+    return f'status code of {self.request}'
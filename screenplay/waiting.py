@@ -8,7 +8,36 @@ Contains support for waiting for interactions.
 
 import time
 
-from screenplay.core import Task, ScreenplayException
+from collections import deque
+from screenplay.core import Task, ScreenplayException, DeadlineExceededException
+
+
+# --------------------------------------------------------------------------------
+# Class: WaitHistory
+# --------------------------------------------------------------------------------
+
+class WaitHistory:
+  """
+  Records the polls made while waiting.
+  Only changes in the answer are kept, in a ring buffer of the given size,
+  so waits that poll thousands of times still use constant memory.
+  """
+
+  def __init__(self, size=10):
+    self.attempts = 0
+    self.elapsed = 0
+    self.answers = deque(maxlen=size)
+    self._start = time.monotonic()
+
+  def record(self, answer):
+    self.attempts += 1
+    self.elapsed = time.monotonic() - self._start
+    if not self.answers or self.answers[-1][2] != answer:
+      self.answers.append((self.attempts, self.elapsed, answer))
+
+  def __str__(self):
+    answers = ', '.join(f'#{attempt} at {elapsed:.3f}s: {answer!r}' for attempt, elapsed, answer in self.answers)
+    return f'{self.attempts} attempts in {self.elapsed:.3f}s (answers {answers})'
 
 
 # --------------------------------------------------------------------------------
@@ -17,26 +46,61 @@ from screenplay.core import Task, ScreenplayException
 
 class WaitUntil(Task):
 
-  def __init__(self, question, condition, timeout=30, interval=0):
+  def __init__(self, question, condition, timeout=30, interval=0, history_size=10):
     self.question = question
     self.condition = condition
     self.timeout = timeout
     self.interval = interval
+    self.history_size = history_size
 
   def perform_as(self, actor):
-    end = time.monotonic() + self.timeout
+    history = WaitHistory(self.history_size)
+
+    # let nested interactions know they are being polled, and by which wait
+    outer = getattr(actor.local, 'wait_history', None)
+    actor.local.waiting = getattr(actor.local, 'waiting', 0) + 1
+    actor.local.wait_history = history
+    try:
+      answer, satisfied = self._poll(actor, history)
+    finally:
+      actor.local.waiting -= 1
+      actor.local.wait_history = outer
+      self._instrument(actor, history)
+
+    if not satisfied:
+      remaining = actor.remaining_time()
+      if remaining is not None and remaining <= 0:
+        raise DeadlineExceededException(actor, self)
+      raise WaitingException(actor, self.question, self.condition, self.timeout, history)
+
+    return answer
+
+  def _poll(self, actor, history):
+    # never wait past the actor's time budget
+    timeout = self.timeout
+    remaining = actor.remaining_time()
+    if remaining is not None:
+      timeout = min(timeout, remaining)
+
+    end = time.monotonic() + timeout
     answer = actor.asks_for(self.question)
+    history.record(answer)
     satisfied = self.condition.evaluate(answer)
 
     while not satisfied and time.monotonic() < end:
-      time.sleep(self.interval)
+      # never sleep past the end of the wait
+      time.sleep(min(self.interval, max(end - time.monotonic(), 0)))
       answer = actor.asks_for(self.question)
+      history.record(answer)
       satisfied = self.condition.evaluate(answer)
 
-    if not satisfied:
-      raise WaitingException(actor, self.question, self.condition, self.timeout)
+    return answer, satisfied
 
-    return answer
+  def _instrument(self, actor, history):
+    if actor.has('instrumentation'):
+      instrumentation = actor.using('instrumentation')
+      instrumentation.count('wait polls', history.attempts)
+      instrumentation.record('wait duration', history.elapsed)
 
   def __str__(self):
     return f'wait until {self.question} {self.condition} for {self.timeout}s'
@@ -47,9 +111,17 @@ class WaitUntil(Task):
 # --------------------------------------------------------------------------------
 
 class WaitingException(ScreenplayException):
-  def __init__(self, actor, question, condition, timeout):
-    super().__init__(f'The actor "{actor}" failed to wait until "{question}" "{condition}" for {timeout}s')
+  def __init__(self, actor, question, condition, timeout, history=None):
+    message = f'The actor "{actor}" failed to wait until "{question}" "{condition}" for {timeout}s'
+    if history is not None:
+      message += f' after {history}'
+    super().__init__(message)
     self.actor = actor
     self.question = question
     self.condition = condition
     self.timeout = timeout
+    self.history = history
+
+  def __reduce__(self):
+    # actors cannot be pickled, so only their names cross processes
+    return (type(self), (str(self.actor), self.question, self.condition, self.timeout, self.history))
@@ -6,32 +6,590 @@ Contains interactions for Selenium WebDriver.
 # Imports
 # --------------------------------------------------------------------------------
 
+import logging
+import threading
+import time
+
 from abc import ABC
-from screenplay.conditions import IsTrue
-from screenplay.core import Question, Task
+from collections import deque
+from screenplay.backends import Backend
+from screenplay.conditions import IsEqualTo, IsNotEqualTo, IsTrue
+from screenplay.core import Question, ScreenplayException, Task
+from screenplay.locators import SHADOW_PATH, Locator, ShadowLocator
 from screenplay.waiting import WaitUntil
-from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
+from selenium.common.exceptions import ElementClickInterceptedException
+from selenium.common.exceptions import NoAlertPresentException, NoSuchElementException, NoSuchFrameException
+from selenium.common.exceptions import StaleElementReferenceException, UnexpectedAlertPresentException
+from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import Select
+from urllib.parse import urlsplit
+
+
+# --------------------------------------------------------------------------------
+# Logging
+# --------------------------------------------------------------------------------
+
+logger = logging.getLogger(__name__)
+
+
+# --------------------------------------------------------------------------------
+# JavaScript: findAll
+# --------------------------------------------------------------------------------
+
+# Resolves a Selenium (qtype, query) pair to its matching elements inside the browser.
+# Prepend this to a script to answer questions with one command and a small payload
+# instead of transferring every element reference back to Python.
+
+FIND_ALL_JS = """
+var findAll = function(qtype, query, root) {
+  root = root || document;
+  switch (qtype) {
+    case 'css selector':
+      return Array.prototype.slice.call(root.querySelectorAll(query));
+    case 'id':
+      return Array.prototype.slice.call(root.querySelectorAll('#' + CSS.escape(query)));
+    case 'name':
+      return Array.prototype.slice.call(root.querySelectorAll('[name="' + CSS.escape(query) + '"]'));
+    case 'class name':
+      return Array.prototype.slice.call(root.querySelectorAll('.' + CSS.escape(query)));
+    case 'tag name':
+      return Array.prototype.slice.call(root.querySelectorAll(query));
+    case 'link text':
+      return Array.prototype.filter.call(root.querySelectorAll('a'), function(a) {
+        return a.innerText.trim() === query;
+      });
+    case 'partial link text':
+      return Array.prototype.filter.call(root.querySelectorAll('a'), function(a) {
+        return a.innerText.indexOf(query) >= 0;
+      });
+    case 'shadow path':
+      var hosts = [root];
+      query.forEach(function(selector, depth) {
+        var matches = [];
+        hosts.forEach(function(host) {
+          var scope = depth === 0 ? host : host.shadowRoot;
+          if (scope) {
+            matches = matches.concat(Array.prototype.slice.call(scope.querySelectorAll(selector)));
+          }
+        });
+        hosts = matches;
+      });
+      return hosts;
+    case 'xpath':
+      var snapshot = document.evaluate(query, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+      var nodes = [];
+      for (var i = 0; i < snapshot.snapshotLength; i++) {
+        nodes.push(snapshot.snapshotItem(i));
+      }
+      return nodes;
+    default:
+      throw new Error('Unsupported locator type: ' + qtype);
+  }
+};
+"""
+
+# Return every match, or the first match or null, for the (qtype, query) in the arguments
+
+FIND_ELEMENTS_JS = FIND_ALL_JS + 'return findAll(arguments[0], arguments[1]);'
+
+FIND_ELEMENT_JS = FIND_ALL_JS + 'return findAll(arguments[0], arguments[1])[0] || null;'
+
+# Counts the matches of the first strategy in arguments[0] that matches anything
+
+COUNT_FIRST_MATCHING_JS = FIND_ALL_JS + """
+var strategies = arguments[0];
+for (var i = 0; i < strategies.length; i++) {
+  var count = findAll(strategies[i][0], strategies[i][1]).length;
+  if (count > 0) {
+    return count;
+  }
+}
+return 0;
+"""
+
+# Finds the first element matched by any strategy in a list of (qtype, query) pairs
+
+FIND_FIRST_JS = FIND_ALL_JS + """
+var findFirst = function(strategies) {
+  for (var i = 0; i < strategies.length; i++) {
+    var found = findAll(strategies[i][0], strategies[i][1]);
+    if (found.length > 0) {
+      return found[0];
+    }
+  }
+  return null;
+};
+"""
+
+# Returns true only if every list of strategies in arguments[0] finds a displayed element
+
+ALL_APPEARED_JS = FIND_FIRST_JS + """
+return arguments[0].every(function(strategies) {
+  var element = findFirst(strategies);
+  return element !== null && element.getClientRects().length > 0;
+});
+"""
+
+# Sets the value of each [strategies, value] field in arguments[0] and returns the elements.
+# The native setter is used so that frameworks still see input and change events.
+
+SET_FIELD_VALUES_JS = FIND_FIRST_JS + """
+return arguments[0].map(function(field) {
+  var element = findFirst(field[0]);
+  if (!element) {
+    throw new Error('No element matches ' + JSON.stringify(field[0]));
+  }
+  var setter = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(element), 'value').set;
+  element.focus();
+  setter.call(element, field[1]);
+  element.dispatchEvent(new Event('input', {bubbles: true}));
+  element.dispatchEvent(new Event('change', {bubbles: true}));
+  return element;
+});
+"""
+
+
+# Instruments the page once with a pending fetch/XHR counter and a long task observer,
+# then reports readiness. Requests started before the first call are not counted.
+
+PAGE_READINESS_JS = """
+var state = window.__screenplayReadiness;
+if (!state) {
+  state = window.__screenplayReadiness = {pending: 0, lastLongTask: 0};
+  if (window.fetch) {
+    var fetch = window.fetch;
+    window.fetch = function() {
+      state.pending++;
+      return fetch.apply(this, arguments).finally(function() { state.pending--; });
+    };
+  }
+  var send = XMLHttpRequest.prototype.send;
+  XMLHttpRequest.prototype.send = function() {
+    state.pending++;
+    this.addEventListener('loadend', function() { state.pending--; });
+    return send.apply(this, arguments);
+  };
+  if (window.PerformanceObserver) {
+    try {
+      new PerformanceObserver(function(list) {
+        list.getEntries().forEach(function(entry) {
+          state.lastLongTask = Math.max(state.lastLongTask, entry.startTime + entry.duration);
+        });
+      }).observe({entryTypes: ['longtask']});
+    } catch (e) {
+      // long tasks are not supported by every browser
+    }
+  }
+}
+return {
+  readyState: document.readyState,
+  pendingRequests: state.pending,
+  idleTime: (performance.now() - state.lastLongTask) / 1000
+};
+"""
+
+# Collects Navigation Timing and the slowest Resource Timing entries in seconds
+
+PAGE_LOAD_METRICS_JS = """
+var navigation = performance.getEntriesByType('navigation')[0];
+if (!navigation) {
+  return null;
+}
+var resources = performance.getEntriesByType('resource').map(function(entry) {
+  return {
+    name: entry.name,
+    initiatorType: entry.initiatorType,
+    duration: entry.duration / 1000,
+    transferSize: entry.transferSize
+  };
+});
+resources.sort(function(a, b) { return b.duration - a.duration; });
+return {
+  url: location.href,
+  ttfb: navigation.responseStart / 1000,
+  domContentLoaded: navigation.domContentLoadedEventEnd / 1000,
+  load: navigation.loadEventEnd / 1000,
+  resourceCount: resources.length,
+  slowestResources: resources.slice(0, arguments[0])
+};
+"""
+
+# Dumps the origin plus localStorage and sessionStorage of the current page
+
+STORAGE_STATE_JS = """
+var dump = function(storage) {
+  var items = {};
+  for (var i = 0; i < storage.length; i++) {
+    var key = storage.key(i);
+    items[key] = storage.getItem(key);
+  }
+  return items;
+};
+return {
+  origin: location.origin,
+  localStorage: dump(localStorage),
+  sessionStorage: dump(sessionStorage)
+};
+"""
+
+# Loads the localStorage and sessionStorage items of the state in arguments[0]
+
+RESTORE_STORAGE_JS = """
+var load = function(storage, items) {
+  Object.keys(items).forEach(function(key) {
+    storage.setItem(key, items[key]);
+  });
+};
+load(localStorage, arguments[0].localStorage);
+load(sessionStorage, arguments[0].sessionStorage);
+"""
+
+
+# Scrolls arguments[0] to the middle of the viewport, clear of sticky headers and footers
 
+SCROLL_INTO_VIEW_JS = "arguments[0].scrollIntoView({block: 'center', inline: 'center'});"
+
+# Scrolls the element in arguments[0], or the whole page without one, to the end
+# and returns the new scroll height so that callers can tell whether more content loaded
+
+SCROLL_TO_END_JS = """
+var target = arguments[0] || document.scrollingElement || document.documentElement;
+target.scrollTop = target.scrollHeight;
+return target.scrollHeight;
+"""
+
+# Reads [key, text] pairs for the elements matched by the first matching strategy
+# in arguments[0], keyed by the attribute in arguments[1] or else by text,
+# then scrolls the container in arguments[2], or else the last element, to load more
+
+READ_AND_SCROLL_JS = FIND_ALL_JS + """
+var elements = [];
+for (var i = 0; i < arguments[0].length && elements.length === 0; i++) {
+  elements = findAll(arguments[0][i][0], arguments[0][i][1]);
+}
+var key = arguments[1];
+var items = elements.map(function(element) {
+  var text = element.innerText;
+  var value = key ? element.getAttribute(key) : null;
+  return [value === null ? text : value, text];
+});
+if (arguments[2]) {
+  arguments[2].scrollTop = arguments[2].scrollHeight;
+} else if (elements.length > 0) {
+  elements[elements.length - 1].scrollIntoView({block: 'end'});
+}
+return items;
+"""
+
+# Captures uncaught errors, unhandled rejections and console.error calls in the page
+# as log entries shaped like WebDriver's, then returns and clears those captured so far.
+# Capture is installed on the first call after each page load
+
+DRAIN_CAPTURED_ERRORS_JS = """
+if (!window.__screenplayErrors) {
+  var errors = window.__screenplayErrors = [];
+  var capture = function(message) {
+    errors.push({level: 'SEVERE', source: 'javascript', message: String(message), timestamp: Date.now()});
+  };
+  window.addEventListener('error', function(event) {
+    capture(event.message + ' (' + event.filename + ':' + event.lineno + ')');
+  });
+  window.addEventListener('unhandledrejection', function(event) {
+    capture('Unhandled rejection: ' + event.reason);
+  });
+  var consoleError = console.error;
+  console.error = function() {
+    capture(Array.prototype.join.call(arguments, ' '));
+    return consoleError.apply(console, arguments);
+  };
+}
+return window.__screenplayErrors.splice(0);
+"""
 
 # --------------------------------------------------------------------------------
-# Class: Locator
+# Class: SeleniumBackend
 # --------------------------------------------------------------------------------
 
-class Locator:
+class SeleniumBackend(Backend):
 
-  def __init__(self, name, qtype, query):
-    self.name = name
-    self.qtype = qtype
-    self.query = query
+  def __init__(self, driver):
+    self.driver = driver
 
-  def __str__(self):
-    return self.name
+  def __getattr__(self, name):
+    # window, frame, alert, cookie and screenshot commands go straight to the driver
+    return getattr(self.driver, name)
+
+  def find_element(self, qtype, query):
+    return self.driver.find_element(qtype, query)
+
+  def find_elements(self, qtype, query):
+    return self.driver.find_elements(qtype, query)
+
+  def execute_script(self, script, *args):
+    return self.driver.execute_script(script, *args)
+
+  def get(self, url):
+    self.driver.get(url)
+
+  def refresh(self):
+    self.driver.refresh()
+
+  @property
+  def current_url(self):
+    return self.driver.current_url
+
+  @property
+  def title(self):
+    return self.driver.title
+
+  def hover(self, element):
+    ActionChains(self.driver).move_to_element(element).perform()
+
+  def pointer_click(self, element):
+    ActionChains(self.driver).move_to_element(element).click().perform()
+
+  def type_into(self, elements_and_keys):
+    # one action sequence types into every element
+    actions = ActionChains(self.driver)
+    for element, keys in elements_and_keys:
+      actions.send_keys_to_element(element, keys)
+    actions.perform()
+
+  def select(self, element):
+    return Select(element)
+
+  def quit(self):
+    self.driver.quit()
+
+
+def browser(actor):
+  driver = actor.using('webdriver')
+  return driver if isinstance(driver, Backend) else SeleniumBackend(driver)
+
+
+# --------------------------------------------------------------------------------
+# Class: BrowsingContext
+# --------------------------------------------------------------------------------
 
-  def __repr__(self):
-    return f"{self.qtype}: {self.query}"
+# Remembers the window handles and the active window an actor's browser is using,
+# so that tasks can skip redundant switching commands.
+# Switch windows through these tasks instead of the driver to keep it accurate.
+
+class BrowsingContext:
+
+  def __init__(self):
+    self.window = None
+    self.handles = None
+    self.frames = ()
+
+  def add_handles(self, handles):
+    known = self.handles or []
+    self.handles = known + [h for h in handles if h not in known]
+
+  def remove_handle(self, handle):
+    if self.handles is not None and handle in self.handles:
+      self.handles = [h for h in self.handles if h != handle]
+    if self.window == handle:
+      self.window = None
+
+
+def browsing_context(actor):
+  if not actor.has('browsing_context'):
+    actor.can_use(browsing_context=BrowsingContext())
+  return actor.using('browsing_context')
+
+
+def enter_frames(actor, frames):
+  # switch only as far as needed from the current frame to the target frame path
+  context = browsing_context(actor)
+  current = context.frames
+  if current == frames:
+    return
+
+  driver = browser(actor)
+  if current[:len(frames)] == frames and len(current) - len(frames) == 1:
+    driver.switch_to.parent_frame()
+    context.frames = frames
+    return
+  if frames[:len(current)] != current:
+    driver.switch_to.default_content()
+    context.frames = ()
+
+  for frame in frames[len(context.frames):]:
+    element = LocatorInteraction(frame).find_element(actor)
+    driver.switch_to.frame(element)
+    context.frames = context.frames + (frame,)
+
+
+def reset_frames(actor):
+  browsing_context(actor).frames = ()
+
+
+def page_url(actor):
+  # polled lookups read the page's URL once per wait instead of once per poll
+  history = getattr(actor.local, 'wait_history', None)
+  if history is None:
+    return browser(actor).current_url
+  polled = getattr(actor.local, 'polled_page', None)
+  if polled is None or polled[0] is not history:
+    polled = actor.local.polled_page = (history, browser(actor).current_url)
+  return polled[1]
+
+
+def group_by_frames(locators):
+  # scripts only see the document they run in, so locators are resolved frame by frame
+  groups = dict()
+  for locator in locators:
+    groups.setdefault(locator.frame_path, []).append(locator)
+  return groups
+
+
+def reset_entered_frames(actor):
+  # a frame that went stale after it was entered was re-rendered or navigated away,
+  # so start again from the top-level document
+  if not browsing_context(actor).frames:
+    return False
+  browser(actor).switch_to.default_content()
+  reset_frames(actor)
+  return True
+
+
+def window_handles(actor):
+  context = browsing_context(actor)
+  if context.handles is None:
+    context.handles = list(browser(actor).window_handles)
+  return context.handles
+
+
+# --------------------------------------------------------------------------------
+# Alert Policy
+# --------------------------------------------------------------------------------
+
+# Give an actor an 'alert_policy' ability of 'accept' or 'dismiss' to handle
+# unexpected alerts. The policy is applied only after WebDriver reports one,
+# so it costs no extra commands while no alert is open.
+
+ALERT_POLICIES = ('accept', 'dismiss')
+
+
+def handle_unexpected_alert(actor):
+  if not actor.has('alert_policy'):
+    return False
+  policy = actor.using('alert_policy')
+  if policy not in ALERT_POLICIES:
+    raise ScreenplayException(f'The alert policy "{policy}" must be one of {", ".join(ALERT_POLICIES)}')
+  try:
+    alert = browser(actor).switch_to.alert
+    logger.warning(f'{actor} will {policy} an unexpected alert: "{alert.text}"')
+    getattr(alert, policy)()
+  except NoAlertPresentException:
+    # the browser may already have closed the alert when it reported it
+    pass
+  return True
+
+
+def with_alert_policy(actor, command):
+  try:
+    return command()
+  except UnexpectedAlertPresentException:
+    if not handle_unexpected_alert(actor):
+      raise
+    return command()
+
+
+# --------------------------------------------------------------------------------
+# Class: BrowserLogCollector
+# --------------------------------------------------------------------------------
+
+# Drains browser logs on a background thread into a bounded buffer,
+# so that tasks do not pay for log commands on every step.
+# Give it to a thread-safe actor as the 'browser_logs' ability;
+# it holds the actor's 'webdriver' lock while draining:
+#
+#   actor.can_use(browser_logs=LazyAbility(
+#     lambda: BrowserLogCollector(actor).start(), teardown=BrowserLogCollector.stop))
+#
+# Browsers that do not support WebDriver logs can set capture_errors=True instead.
+
+class BrowserLogCollector:
+
+  def __init__(self, actor, interval=1, size=1000, log_type='browser', capture_errors=False):
+    if not actor.thread_safe:
+      raise ScreenplayException(f'The actor "{actor}" must be thread-safe to collect browser logs in the background')
+    self.actor = actor
+    self.interval = interval
+    self.log_type = log_type
+    self.capture_errors = capture_errors
+    self._entries = deque(maxlen=size)
+    self._lock = threading.Lock()
+    self._stopped = threading.Event()
+    self._thread = None
+
+  def start(self):
+    self._stopped.clear()
+    self._thread = threading.Thread(target=self._run, name=f'{self.actor} browser logs', daemon=True)
+    self._thread.start()
+    return self
+
+  def stop(self):
+    self._stopped.set()
+    if self._thread is not None:
+      self._thread.join()
+      self._thread = None
+    self.drain_quietly()
+
+  def drain(self):
+    entries = []
+    with self.actor.exclusively('webdriver') as driver:
+      if self.log_type and hasattr(driver, 'get_log'):
+        entries.extend(driver.get_log(self.log_type))
+      if self.capture_errors:
+        entries.extend(driver.execute_script(DRAIN_CAPTURED_ERRORS_JS) or [])
+    with self._lock:
+      self._entries.extend(entries)
+    return entries
+
+  def entries(self, level=None):
+    with self._lock:
+      return [e for e in self._entries if level is None or e.get('level') == level]
+
+  def drain_quietly(self):
+    try:
+      self.drain()
+    except (WebDriverException, ScreenplayException) as e:
+      # the browser may be busy, navigating or already closed
+      logger.debug(f'{self.actor} could not collect browser logs: {e}')
+
+  def _run(self):
+    while not self._stopped.wait(self.interval):
+      self.drain_quietly()
+
+
+# --------------------------------------------------------------------------------
+# Locator Profiling
+# --------------------------------------------------------------------------------
+
+# Element lookups are timed for an actor's 'locator_profiler' ability, if it has one.
+# Scripts that resolve several locators in one command share its time between them,
+# and are recorded under each locator's primary strategy.
+
+def record_lookup(actor, locator, strategy, duration):
+  polled = getattr(actor.local, 'waiting', 0) > 0
+  actor.using('locator_profiler').record(locator, strategy, duration, polled)
+
+
+def profile_script(actor, locators, command):
+  if not actor.has('locator_profiler'):
+    return command()
+  start = time.monotonic()
+  try:
+    return command()
+  finally:
+    share = (time.monotonic() - start) / len(locators)
+    for locator in locators:
+      record_lookup(actor, locator, locator.strategies[0], share)
 
 
 # --------------------------------------------------------------------------------
@@ -46,6 +604,80 @@ class LocatorInteraction(ABC):
   def loc(self):
     return (self.locator.qtype, self.locator.query)
 
+  def _cache(self, actor):
+    if self.locator.fallbacks and actor.has('locator_cache'):
+      return actor.using('locator_cache')
+    return None
+
+  def strategies(self, actor):
+    cache = self._cache(actor)
+    if cache is None:
+      return self.locator.strategies
+    return cache.order(page_url(actor), self.locator)
+
+  def _lookup(self, driver, method, strategy):
+    if strategy[0] != SHADOW_PATH:
+      return getattr(driver, method)(*strategy)
+
+    # WebDriver cannot pierce shadow roots, so resolve the whole path in one script
+    if method == 'find_elements':
+      return driver.execute_script(FIND_ELEMENTS_JS, *strategy)
+    element = driver.execute_script(FIND_ELEMENT_JS, *strategy)
+    if element is None:
+      raise NoSuchElementException(f'Unable to locate element: {self.locator!r}')
+    return element
+
+  def _call(self, actor, driver, method, strategy):
+    if not actor.has('locator_profiler'):
+      return self._lookup(driver, method, strategy)
+    start = time.monotonic()
+    try:
+      return self._lookup(driver, method, strategy)
+    finally:
+      record_lookup(actor, self.locator, strategy, time.monotonic() - start)
+
+  def _find(self, actor, method):
+    # a plain miss is answered as it is, so polling inside frames costs one command
+    try:
+      return self._find_in_frames(actor, method)
+    except (NoSuchFrameException, StaleElementReferenceException):
+      if not reset_entered_frames(actor):
+        raise
+      return self._find_in_frames(actor, method)
+
+  def _find_in_frames(self, actor, method):
+    enter_frames(actor, self.locator.frame_path)
+    driver = browser(actor)
+    if not self.locator.fallbacks:
+      return self._call(actor, driver, method, self.loc())
+
+    # try each strategy in turn, remembering which ones work and how fast
+    cache = self._cache(actor)
+    page = page_url(actor) if cache is not None else None
+    strategies = self.locator.strategies if cache is None else cache.order(page, self.locator)
+    error = None
+    for strategy in strategies:
+      start = time.monotonic()
+      try:
+        result = self._call(actor, driver, method, strategy)
+      except NoSuchElementException as e:
+        result, error = None, e
+      if result:
+        if cache is not None:
+          cache.record_success(page, self.locator, strategy, time.monotonic() - start)
+        return result
+      if cache is not None:
+        cache.record_failure(page, self.locator, strategy)
+    if error:
+      raise error
+    return result
+
+  def find_element(self, actor):
+    return with_alert_policy(actor, lambda: self._find(actor, 'find_element'))
+
+  def find_elements(self, actor):
+    return with_alert_policy(actor, lambda: self._find(actor, 'find_elements'))
+
 
 # --------------------------------------------------------------------------------
 # Abstract Class: SelectInteraction
@@ -55,11 +687,73 @@ class SelectInteraction(LocatorInteraction, ABC):
 
   def get_select(self, actor):
     actor.attempts_to(WaitUntil(ExistenceOf(self.locator), IsTrue()))
-    driver = actor.using('webdriver')
-    select = Select(driver.find_element(*self.loc()))
+    select = browser(actor).select(self.find_element(actor))
     return select
 
 
+# --------------------------------------------------------------------------------
+# Task: AcceptAlert
+# --------------------------------------------------------------------------------
+
+class AcceptAlert(Task):
+
+  def perform_as(self, actor):
+    browser(actor).switch_to.alert.accept()
+
+  def __str__(self):
+    return f'accept the alert'
+
+
+# --------------------------------------------------------------------------------
+# Task: AddCookies
+# --------------------------------------------------------------------------------
+
+class AddCookies(Task):
+
+  def __init__(self, *cookies):
+    self.cookies = cookies
+
+  def perform_as(self, actor):
+    driver = browser(actor)
+    for cookie in self.cookies:
+      driver.add_cookie(cookie)
+
+  def __str__(self):
+    return f'add cookies {", ".join(c["name"] for c in self.cookies)}'
+
+
+# --------------------------------------------------------------------------------
+# Question: AlertPresence
+# --------------------------------------------------------------------------------
+
+class AlertPresence(Question):
+
+  def request_as(self, actor):
+    try:
+      # a single command: fetching the alert text fails when there is no alert
+      browser(actor).switch_to.alert
+      present = True
+    except NoAlertPresentException:
+      present = False
+    return present
+
+  def __str__(self):
+    return f'alert presence'
+
+
+# --------------------------------------------------------------------------------
+# Question: AlertText
+# --------------------------------------------------------------------------------
+
+class AlertText(Question):
+
+  def request_as(self, actor):
+    return browser(actor).switch_to.alert.text
+
+  def __str__(self):
+    return f'alert text'
+
+
 # --------------------------------------------------------------------------------
 # Question: AppearanceOf
 # --------------------------------------------------------------------------------
@@ -68,8 +762,7 @@ class AppearanceOf(Question, LocatorInteraction):
 
   def request_as(self, actor):
     try:
-      driver = actor.using('webdriver')
-      appeared = driver.find_element(*self.loc()).is_displayed()
+      appeared = self.find_element(actor).is_displayed()
     except (NoSuchElementException, StaleElementReferenceException):
       # if the element isn't found, then it doesn't exist
       appeared = False
@@ -79,6 +772,69 @@ class AppearanceOf(Question, LocatorInteraction):
     return f'appearance of {self.locator}'
 
 
+# --------------------------------------------------------------------------------
+# Question: AppearanceOfAll
+# --------------------------------------------------------------------------------
+
+class AppearanceOfAll(Question):
+
+  def __init__(self, *locators):
+    self.locators = locators
+
+  def request_as(self, actor):
+    # one script per frame, stopping at the first frame with a missing element
+    for frames, locators in group_by_frames(self.locators).items():
+      if not with_alert_policy(actor, lambda: self._ask(actor, frames, locators)):
+        return False
+    return True
+
+  def _ask(self, actor, frames, locators):
+    enter_frames(actor, frames)
+    driver = browser(actor)
+    strategies = [l.strategies for l in locators]
+    return profile_script(actor, locators, lambda: driver.execute_script(ALL_APPEARED_JS, strategies))
+
+  def __str__(self):
+    return f'appearance of all of {", ".join(str(l) for l in self.locators)}'
+
+
+# --------------------------------------------------------------------------------
+# Question: BrowserState
+# --------------------------------------------------------------------------------
+
+class BrowserState(Question):
+
+  def request_as(self, actor):
+    enter_frames(actor, ())
+    driver = browser(actor)
+    state = driver.execute_script(STORAGE_STATE_JS)
+    state['cookies'] = driver.get_cookies()
+    return state
+
+  def __str__(self):
+    return f'browser state'
+
+
+# --------------------------------------------------------------------------------
+# Question: BrowserLogs
+# --------------------------------------------------------------------------------
+
+class BrowserLogs(Question):
+
+  def __init__(self, level=None, fresh=True):
+    self.level = level
+    self.fresh = fresh
+
+  def request_as(self, actor):
+    collector = actor.using('browser_logs')
+    if self.fresh:
+      collector.drain()
+    return collector.entries(self.level)
+
+  def __str__(self):
+    return 'browser logs' if self.level is None else f'{self.level} browser logs'
+
+
 # --------------------------------------------------------------------------------
 # Task: Clear
 # --------------------------------------------------------------------------------
@@ -87,8 +843,7 @@ class Clear(Task, LocatorInteraction):
 
   def perform_as(self, actor):
     actor.attempts_to(WaitUntil(AppearanceOf(self.locator), IsTrue()))
-    driver = actor.using('webdriver')
-    driver.find_element(*self.loc()).clear()
+    self.find_element(actor).clear()
     
   def __str__(self):
     return f'clear {self.locator}'
@@ -100,16 +855,64 @@ class Clear(Task, LocatorInteraction):
 
 class Click(Task, LocatorInteraction):
 
+  def __init__(self, locator, fast=False):
+    super().__init__(locator)
+    self.fast = fast
+
   def perform_as(self, actor):
     actor.attempts_to(WaitUntil(AppearanceOf(self.locator), IsTrue()))
-    driver = actor.using('webdriver')
-    element = driver.find_element(*self.loc())
-    ActionChains(driver).move_to_element(element).click().perform()
+    driver = browser(actor)
+    element = self.find_element(actor)
+
+    if self.fast:
+      try:
+        # WebDriver scrolls the element into view as part of the click command
+        element.click()
+        return
+      except ElementClickInterceptedException:
+        driver.execute_script(SCROLL_INTO_VIEW_JS, element)
+
+    driver.pointer_click(element)
     
   def __str__(self):
     return f'click {self.locator}'
 
 
+# --------------------------------------------------------------------------------
+# Task: CloseWindow
+# --------------------------------------------------------------------------------
+
+class CloseWindow(Task):
+
+  def perform_as(self, actor):
+    driver = browser(actor)
+    context = browsing_context(actor)
+    closed = context.window or driver.current_window_handle
+    driver.close()
+    context.remove_handle(closed)
+
+    # the driver has no current window after closing one, so fall back to the first
+    remaining = window_handles(actor)
+    if remaining:
+      actor.attempts_to(SwitchToWindow(remaining[0]))
+
+  def __str__(self):
+    return f'close the current window'
+
+
+# --------------------------------------------------------------------------------
+# Question: Cookies
+# --------------------------------------------------------------------------------
+
+class Cookies(Question):
+
+  def request_as(self, actor):
+    return browser(actor).get_cookies()
+
+  def __str__(self):
+    return f'cookies'
+
+
 # --------------------------------------------------------------------------------
 # Question: CountOf
 # --------------------------------------------------------------------------------
@@ -117,9 +920,14 @@ class Click(Task, LocatorInteraction):
 class CountOf(Question, LocatorInteraction):
 
   def request_as(self, actor):
-    driver = actor.using('webdriver')
-    elements = driver.find_elements(*self.loc())
-    return len(elements)
+    return with_alert_policy(actor, lambda: self._count(actor))
+
+  def _count(self, actor):
+    enter_frames(actor, self.locator.frame_path)
+    driver = browser(actor)
+    strategies = self.strategies(actor)
+    return profile_script(actor, [self.locator],
+      lambda: driver.execute_script(COUNT_FIRST_MATCHING_JS, strategies))
 
   def __str__(self):
     return f'count of {self.locator}'
@@ -136,8 +944,7 @@ class CssClassesOf(Question, LocatorInteraction):
 
   def request_as(self, actor):
     actor.attempts_to(WaitUntil(ExistenceOf(self.locator), IsTrue()))
-    driver = actor.using('webdriver')
-    classes = driver.find_element(*self.loc()).get_attribute('class')
+    classes = self.find_element(actor).get_attribute('class')
     return classes.split()
 
   def __str__(self):
@@ -156,8 +963,7 @@ class CssPropertyValueOf(Question, LocatorInteraction):
 
   def request_as(self, actor):
     actor.attempts_to(WaitUntil(ExistenceOf(self.locator), IsTrue()))
-    driver = actor.using('webdriver')
-    return driver.find_element(*self.loc()).value_of_css_property(self.prop_name)
+    return self.find_element(actor).value_of_css_property(self.prop_name)
 
   def __str__(self):
     return f'CSS property value "{self.prop_name}" of {self.locator}'
@@ -170,12 +976,55 @@ class CssPropertyValueOf(Question, LocatorInteraction):
 class CurrentUrl(Question):
 
   def request_as(self, actor):
-    return actor.using('webdriver').current_url
+    return browser(actor).current_url
 
   def __str__(self):
     return f'current URL'
 
 
+# --------------------------------------------------------------------------------
+# Task: DeleteAllCookies
+# --------------------------------------------------------------------------------
+
+class DeleteAllCookies(Task):
+
+  def perform_as(self, actor):
+    browser(actor).delete_all_cookies()
+
+  def __str__(self):
+    return f'delete all cookies'
+
+
+# --------------------------------------------------------------------------------
+# Task: DismissAlert
+# --------------------------------------------------------------------------------
+
+class DismissAlert(Task):
+
+  def perform_as(self, actor):
+    browser(actor).switch_to.alert.dismiss()
+
+  def __str__(self):
+    return f'dismiss the alert'
+
+
+# --------------------------------------------------------------------------------
+# Question: DocumentReadyState
+# --------------------------------------------------------------------------------
+
+class DocumentReadyState(Question):
+
+  def request_as(self, actor):
+    return with_alert_policy(actor, lambda: self._ask(actor))
+
+  def _ask(self, actor):
+    enter_frames(actor, ())
+    return browser(actor).execute_script('return document.readyState;')
+
+  def __str__(self):
+    return f'document ready state'
+
+
 # --------------------------------------------------------------------------------
 # Question: EnabledStateOf
 # --------------------------------------------------------------------------------
@@ -184,8 +1033,7 @@ class EnabledStateOf(Question, LocatorInteraction):
 
   def request_as(self, actor):
     actor.attempts_to(WaitUntil(ExistenceOf(self.locator), IsTrue()))
-    driver = actor.using('webdriver')
-    return driver.find_element(*self.loc()).is_enabled()
+    return self.find_element(actor).is_enabled()
 
   def __str__(self):
     return f'enabled state of {self.locator}'
@@ -198,14 +1046,50 @@ class EnabledStateOf(Question, LocatorInteraction):
 class ExistenceOf(Question, LocatorInteraction):
 
   def request_as(self, actor):
-    driver = actor.using('webdriver')
-    elements = driver.find_elements(*self.loc())
-    return len(elements) > 0
+    try:
+      # find_element stops at the first match instead of returning every match
+      self.find_element(actor)
+      exists = True
+    except NoSuchElementException:
+      exists = False
+    return exists
 
   def __str__(self):
     return f'existence of {self.locator}'
 
 
+# --------------------------------------------------------------------------------
+# Task: FillForm
+# --------------------------------------------------------------------------------
+
+class FillForm(Task):
+
+  def __init__(self, fields, keyboard=False):
+    self.fields = dict(fields)
+    self.keyboard = keyboard
+
+  def perform_as(self, actor):
+    actor.attempts_to(WaitUntil(AppearanceOfAll(*self.fields), IsTrue()))
+    for frames, locators in group_by_frames(self.fields).items():
+      enter_frames(actor, frames)
+      self._fill(actor, locators)
+
+  def _fill(self, actor, locators):
+    driver = browser(actor)
+    values = [str(self.fields[l]) for l in locators]
+    if self.keyboard:
+      # clear every field in one script, then type into all of them in one action sequence
+      fields = [[l.strategies, ''] for l in locators]
+      elements = profile_script(actor, locators, lambda: driver.execute_script(SET_FIELD_VALUES_JS, fields))
+      driver.type_into(zip(elements, values))
+    else:
+      fields = [[l.strategies, v] for l, v in zip(locators, values)]
+      profile_script(actor, locators, lambda: driver.execute_script(SET_FIELD_VALUES_JS, fields))
+
+  def __str__(self):
+    return f'fill form fields {", ".join(str(l) for l in self.fields)}'
+
+
 # --------------------------------------------------------------------------------
 # Task: HoverOver
 # --------------------------------------------------------------------------------
@@ -214,9 +1098,9 @@ class HoverOver(Task, LocatorInteraction):
 
   def perform_as(self, actor):
     actor.attempts_to(WaitUntil(AppearanceOf(self.locator), IsTrue()))
-    driver = actor.using('webdriver')
-    element = driver.find_element(*self.loc())
-    ActionChains(driver).move_to_element(element).perform()
+    driver = browser(actor)
+    element = self.find_element(actor)
+    driver.hover(element)
     
   def __str__(self):
     return f'hover over {self.locator}'
@@ -234,13 +1118,29 @@ class HtmlAttributeOf(Question, LocatorInteraction):
 
   def request_as(self, actor):
     actor.attempts_to(WaitUntil(ExistenceOf(self.locator), IsTrue()))
-    driver = actor.using('webdriver')
-    return driver.find_element(*self.loc()).get_attribute(self.attribute)
+    return self.find_element(actor).get_attribute(self.attribute)
 
   def __str__(self):
     return f'HTML attribute "{self.attribute}" of {self.locator}'
 
 
+# --------------------------------------------------------------------------------
+# Question: JavaScriptErrors
+# --------------------------------------------------------------------------------
+
+class JavaScriptErrors(BrowserLogs):
+
+  def __init__(self, fresh=True):
+    super().__init__('SEVERE', fresh)
+
+  def request_as(self, actor):
+    # failed network requests are also logged as severe
+    return [e for e in super().request_as(actor) if e.get('source') != 'network']
+
+  def __str__(self):
+    return 'JavaScript errors'
+
+
 # --------------------------------------------------------------------------------
 # Question: JavaScriptInBrowser
 # --------------------------------------------------------------------------------
@@ -252,7 +1152,7 @@ class JavaScriptInBrowser(Question):
     self.args = args
 
   def request_as(self, actor):
-    driver = actor.using('webdriver')
+    driver = browser(actor)
     return driver.execute_script(self.script, *self.args)
 
   def __str__(self):
@@ -267,8 +1167,7 @@ class LocationOf(Question, LocatorInteraction):
 
   def request_as(self, actor):
     actor.attempts_to(WaitUntil(ExistenceOf(self.locator), IsTrue()))
-    driver = actor.using('webdriver')
-    return driver.find_element(*self.loc()).location
+    return self.find_element(actor).location
 
   def __str__(self):
     return f'location of {self.locator}'
@@ -281,7 +1180,7 @@ class LocationOf(Question, LocatorInteraction):
 class MaximizeWindow(Task):
 
   def perform_as(self, actor):
-    actor.using('webdriver').maximize_window()
+    browser(actor).maximize_window()
     
   def __str__(self):
     return f'maximize the browser window'
@@ -294,7 +1193,7 @@ class MaximizeWindow(Task):
 class MinimizeWindow(Task):
 
   def perform_as(self, actor):
-    actor.using('webdriver').minimize_window()
+    browser(actor).minimize_window()
     
   def __str__(self):
     return f'minimize the browser window'
@@ -306,16 +1205,122 @@ class MinimizeWindow(Task):
 
 class NavigateToUrl(Task):
 
-  def __init__(self, url):
+  def __init__(self, url, measure=False):
     self.url = url
+    self.measure = measure
 
   def perform_as(self, actor):
-    actor.using('webdriver').get(self.url)
+    browser(actor).get(self.url)
+    reset_frames(actor)
+    if self.measure:
+      return self._measure(actor)
+
+  def _measure(self, actor):
+    metrics = actor.asks_for(PageLoadMetrics())
+    if metrics and actor.has('instrumentation'):
+      instrumentation = actor.using('instrumentation')
+      # with an eager or none page load strategy, later events may not have happened yet
+      for metric in ('ttfb', 'domContentLoaded', 'load'):
+        if metrics[metric]:
+          instrumentation.record(f'page {metric}', metrics[metric])
+    return metrics
     
   def __str__(self):
     return f'navigate to {self.url}'
 
 
+# --------------------------------------------------------------------------------
+# Task: NewTab
+# --------------------------------------------------------------------------------
+
+class NewTab(Task):
+
+  def __init__(self, url='about:blank'):
+    self.url = url
+
+  def perform_as(self, actor):
+    # read the handles fresh, since the page may have opened windows since they were cached
+    known = actor.asks_for(WindowHandles())
+    browser(actor).execute_script("window.open(arguments[0], '_blank');", self.url)
+    return actor.attempts_to(WaitForNewWindow(known))
+
+  def __str__(self):
+    return f'open a new tab at {self.url}'
+
+
+# --------------------------------------------------------------------------------
+# Question: NewWindowHandles
+# --------------------------------------------------------------------------------
+
+class NewWindowHandles(Question):
+
+  def __init__(self, known):
+    self.known = known
+
+  def request_as(self, actor):
+    handles = browser(actor).window_handles
+    return [h for h in handles if h not in self.known]
+
+  def __str__(self):
+    return f'new window handles'
+
+
+# --------------------------------------------------------------------------------
+# Question: PageIsIdle
+# --------------------------------------------------------------------------------
+
+class PageIsIdle(Question):
+
+  def __init__(self, quiet=0.5):
+    self.quiet = quiet
+
+  def request_as(self, actor):
+    readiness = actor.asks_for(PageReadiness())
+    return (readiness['readyState'] == 'complete'
+      and readiness['pendingRequests'] == 0
+      and readiness['idleTime'] >= self.quiet)
+
+  def __str__(self):
+    return f'page is idle for {self.quiet}s'
+
+
+# --------------------------------------------------------------------------------
+# Question: PageLoadMetrics
+# --------------------------------------------------------------------------------
+
+class PageLoadMetrics(Question):
+
+  def __init__(self, resources=10):
+    self.resources = resources
+
+  def request_as(self, actor):
+    return with_alert_policy(actor, lambda: self._ask(actor))
+
+  def _ask(self, actor):
+    enter_frames(actor, ())
+    return browser(actor).execute_script(PAGE_LOAD_METRICS_JS, self.resources)
+
+  def __str__(self):
+    return f'page load metrics'
+
+
+# --------------------------------------------------------------------------------
+# Question: PageReadiness
+# --------------------------------------------------------------------------------
+
+class PageReadiness(Question):
+
+  def request_as(self, actor):
+    return with_alert_policy(actor, lambda: self._ask(actor))
+
+  def _ask(self, actor):
+    enter_frames(actor, ())
+    return browser(actor).execute_script(PAGE_READINESS_JS)
+
+  def __str__(self):
+    return f'page readiness'
+
+
 # --------------------------------------------------------------------------------
 # Question: PixelSizeOf
 # --------------------------------------------------------------------------------
@@ -324,8 +1329,7 @@ class PixelSizeOf(Question, LocatorInteraction):
 
   def request_as(self, actor):
     actor.attempts_to(WaitUntil(ExistenceOf(self.locator), IsTrue()))
-    driver = actor.using('webdriver')
-    return driver.find_element(*self.loc()).size
+    return self.find_element(actor).size
 
   def __str__(self):
     return f'pixel size of {self.locator}'
@@ -343,8 +1347,7 @@ class PropertyOf(Question, LocatorInteraction):
 
   def request_as(self, actor):
     actor.attempts_to(WaitUntil(ExistenceOf(self.locator), IsTrue()))
-    driver = actor.using('webdriver')
-    return driver.find_element(*self.loc()).get_property(self.prop_name)
+    return self.find_element(actor).get_property(self.prop_name)
 
   def __str__(self):
     return f'Property "{self.prop_name}" of {self.locator}'
@@ -357,7 +1360,7 @@ class PropertyOf(Question, LocatorInteraction):
 class QuitBrowser(Task):
 
   def perform_as(self, actor):
-    actor.using('webdriver').quit()
+    browser(actor).quit()
     
   def __str__(self):
     return f'quit the browser'
@@ -370,12 +1373,81 @@ class QuitBrowser(Task):
 class RefreshBrowser(Task):
 
   def perform_as(self, actor):
-    actor.using('webdriver').refresh()
+    browser(actor).refresh()
+    reset_frames(actor)
     
   def __str__(self):
     return f'refresh the browser'
 
 
+# --------------------------------------------------------------------------------
+# Task: RestoreBrowserState
+# --------------------------------------------------------------------------------
+
+class RestoreBrowserState(Task):
+
+  def __init__(self, state):
+    self.state = state
+
+  def perform_as(self, actor):
+    enter_frames(actor, ())
+    driver = browser(actor)
+
+    # cookies and storage can only be set for the page's own origin
+    url = urlsplit(driver.current_url)
+    if f'{url.scheme}://{url.netloc}' != self.state['origin']:
+      driver.get(self.state['origin'])
+      reset_frames(actor)
+
+    now = time.time()
+    for cookie in self.state['cookies']:
+      if cookie.get('expiry', now) >= now:
+        driver.add_cookie(cookie)
+    driver.execute_script(RESTORE_STORAGE_JS, self.state)
+
+  def __str__(self):
+    return f'restore browser state for {self.state["origin"]}'
+
+
+# --------------------------------------------------------------------------------
+# Task: RestoreBrowserStateFrom
+# --------------------------------------------------------------------------------
+
+class RestoreBrowserStateFrom(Task):
+
+  def __init__(self, key, max_age=None):
+    self.key = key
+    self.max_age = max_age
+
+  def perform_as(self, actor):
+    state = actor.using('browser_state_cache').fetch(self.key, self.max_age)
+    if state is None:
+      return False
+    actor.attempts_to(RestoreBrowserState(state))
+    return True
+
+  def __str__(self):
+    return f'restore browser state from "{self.key}"'
+
+
+# --------------------------------------------------------------------------------
+# Task: SaveBrowserStateAs
+# --------------------------------------------------------------------------------
+
+class SaveBrowserStateAs(Task):
+
+  def __init__(self, key):
+    self.key = key
+
+  def perform_as(self, actor):
+    cache = actor.using('browser_state_cache')
+    cache.store(self.key, actor.asks_for(BrowserState()))
+    cache.save()
+
+  def __str__(self):
+    return f'save browser state as "{self.key}"'
+
+
 # --------------------------------------------------------------------------------
 # Task: SaveScreenshotTo
 # --------------------------------------------------------------------------------
@@ -386,7 +1458,7 @@ class SaveScreenshotTo(Task):
     self.png_path = png_path
 
   def perform_as(self, actor):
-    actor.using('webdriver').save_screenshot(self.png_path)
+    browser(actor).save_screenshot(self.png_path)
 
   def __str__(self):
     return f'save screenshot to {self.png_path}'
@@ -399,7 +1471,7 @@ class SaveScreenshotTo(Task):
 class ScreenshotAsBase64(Question):
 
   def request_as(self, actor):
-    return actor.using('webdriver').get_screenshot_as_base64()
+    return browser(actor).get_screenshot_as_base64()
 
   def __str__(self):
     return f'screenshot as a base64 encoded string'
@@ -412,12 +1484,67 @@ class ScreenshotAsBase64(Question):
 class ScreenshotAsPng(Question):
 
   def request_as(self, actor):
-    return actor.using('webdriver').get_screenshot_as_png()
+    return browser(actor).get_screenshot_as_png()
 
   def __str__(self):
     return f'screenshot as PNG binary data'
 
 
+# --------------------------------------------------------------------------------
+# Task: ScrollBy
+# --------------------------------------------------------------------------------
+
+class ScrollBy(Task):
+
+  def __init__(self, x, y):
+    self.x = x
+    self.y = y
+
+  def perform_as(self, actor):
+    enter_frames(actor, ())
+    browser(actor).execute_script('window.scrollBy(arguments[0], arguments[1]);', self.x, self.y)
+
+  def __str__(self):
+    return f'scroll by ({self.x}, {self.y})'
+
+
+# --------------------------------------------------------------------------------
+# Task: ScrollTo
+# --------------------------------------------------------------------------------
+
+class ScrollTo(Task, LocatorInteraction):
+
+  def perform_as(self, actor):
+    actor.attempts_to(WaitUntil(ExistenceOf(self.locator), IsTrue()))
+    element = self.find_element(actor)
+    browser(actor).execute_script(SCROLL_INTO_VIEW_JS, element)
+
+  def __str__(self):
+    return f'scroll to {self.locator}'
+
+
+# --------------------------------------------------------------------------------
+# Task: ScrollToEnd
+# --------------------------------------------------------------------------------
+
+class ScrollToEnd(Task):
+
+  def __init__(self, container=None):
+    self.container = container
+
+  def perform_as(self, actor):
+    element = None
+    if self.container:
+      actor.attempts_to(WaitUntil(ExistenceOf(self.container), IsTrue()))
+      element = LocatorInteraction(self.container).find_element(actor)
+    else:
+      enter_frames(actor, ())
+    return browser(actor).execute_script(SCROLL_TO_END_JS, element)
+
+  def __str__(self):
+    return f'scroll to the end of {self.container or "the page"}'
+
+
 # --------------------------------------------------------------------------------
 # Task: SelectByIndex
 # --------------------------------------------------------------------------------
@@ -506,8 +1633,7 @@ class SelectedStateOf(Question, LocatorInteraction):
 
   def request_as(self, actor):
     actor.attempts_to(WaitUntil(ExistenceOf(self.locator), IsTrue()))
-    driver = actor.using('webdriver')
-    return driver.find_element(*self.loc()).is_selected()
+    return self.find_element(actor).is_selected()
 
   def __str__(self):
     return f'selected state of {self.locator}'
@@ -530,8 +1656,7 @@ class SendKeysTo(Task, LocatorInteraction):
 
   def perform_as(self, actor):
     actor.attempts_to(WaitUntil(AppearanceOf(self.locator), IsTrue()))
-    driver = actor.using('webdriver')
-    element = driver.find_element(*self.loc())
+    element = self.find_element(actor)
     if self.clear:
       element.clear()
     element.send_keys(self._get_keys())
@@ -548,13 +1673,66 @@ class Submit(Task, LocatorInteraction):
 
   def perform_as(self, actor):
     actor.attempts_to(WaitUntil(ExistenceOf(self.locator), IsTrue()))
-    driver = actor.using('webdriver')
-    driver.find_element(*self.loc()).submit()
+    self.find_element(actor).submit()
     
   def __str__(self):
     return f'submit {self.locator}'
 
 
+# --------------------------------------------------------------------------------
+# Task: SwitchToDefaultContent
+# --------------------------------------------------------------------------------
+
+class SwitchToDefaultContent(Task):
+
+  def perform_as(self, actor):
+    enter_frames(actor, ())
+
+  def __str__(self):
+    return f'switch to the default content'
+
+
+# --------------------------------------------------------------------------------
+# Task: SwitchToFrame
+# --------------------------------------------------------------------------------
+
+class SwitchToFrame(Task):
+
+  def __init__(self, frame):
+    self.frame = frame
+
+  def perform_as(self, actor):
+    enter_frames(actor, self.frame.frame_path + (self.frame,))
+
+  def __str__(self):
+    return f'switch to frame {self.frame}'
+
+
+# --------------------------------------------------------------------------------
+# Task: SwitchToWindow
+# --------------------------------------------------------------------------------
+
+class SwitchToWindow(Task):
+
+  def __init__(self, handle):
+    self.handle = handle
+
+  def perform_as(self, actor):
+    context = browsing_context(actor)
+    handle = self.handle
+    if isinstance(handle, int):
+      handle = window_handles(actor)[handle]
+    if context.window != handle:
+      browser(actor).switch_to.window(handle)
+      context.window = handle
+      context.frames = ()
+      context.add_handles([handle])
+    return handle
+
+  def __str__(self):
+    return f'switch to window {self.handle}'
+
+
 # --------------------------------------------------------------------------------
 # Question: TagNameOf
 # --------------------------------------------------------------------------------
@@ -563,8 +1741,7 @@ class TagNameOf(Question, LocatorInteraction):
 
   def request_as(self, actor):
     actor.attempts_to(WaitUntil(ExistenceOf(self.locator), IsTrue()))
-    driver = actor.using('webdriver')
-    return driver.find_element(*self.loc()).tag_name
+    return self.find_element(actor).tag_name
 
   def __str__(self):
     return f'tag name of {self.locator}'
@@ -577,7 +1754,7 @@ class TagNameOf(Question, LocatorInteraction):
 class Title(Question):
 
   def request_as(self, actor):
-    return actor.using('webdriver').title
+    return browser(actor).title
 
   def __str__(self):
     return f'title'
@@ -591,8 +1768,7 @@ class TextListOf(Question, LocatorInteraction):
 
   def request_as(self, actor):
     actor.attempts_to(WaitUntil(ExistenceOf(self.locator), IsTrue()))
-    driver = actor.using('webdriver')
-    elements = driver.find_elements(*self.loc())
+    elements = self.find_elements(actor)
     return [x.text for x in elements]
 
   def __str__(self):
@@ -607,13 +1783,73 @@ class TextOf(Question, LocatorInteraction):
 
   def request_as(self, actor):
     actor.attempts_to(WaitUntil(ExistenceOf(self.locator), IsTrue()))
-    driver = actor.using('webdriver')
-    return driver.find_element(*self.loc()).text
+    return self.find_element(actor).text
 
   def __str__(self):
     return f'text of {self.locator}'
 
 
+# --------------------------------------------------------------------------------
+# Question: TextStreamOf
+# --------------------------------------------------------------------------------
+
+# Answers a generator of texts from an infinite-scroll or virtualized list.
+# Each batch is read and scrolled in one script, items are deduplicated by key
+# within a bounded memory of recent keys, and the stream ends once scrolling
+# stops producing new items or the consumer stops iterating.
+# After a batch without new items, the stream pauses for the interval
+# so that pages loading more content asynchronously have time to do so.
+
+class TextStreamOf(Question, LocatorInteraction):
+
+  def __init__(self, locator, key=None, container=None, memory=1000, idle_scrolls=3, interval=0.5):
+    super().__init__(locator)
+    self.key = key
+    self.container = container
+    self.memory = memory
+    self.idle_scrolls = idle_scrolls
+    self.interval = interval
+
+  def request_as(self, actor):
+    actor.attempts_to(WaitUntil(ExistenceOf(self.locator), IsTrue()))
+    return self._stream(actor)
+
+  def _stream(self, actor):
+    container = None
+    if self.container:
+      container = LocatorInteraction(self.container).find_element(actor)
+
+    recent = deque()
+    seen = set()
+    idle = 0
+    while idle < self.idle_scrolls:
+      if idle > 0:
+        time.sleep(self.interval)
+      batch = with_alert_policy(actor, lambda: self._read_and_scroll(actor, container))
+      idle += 1
+      for key, text in batch:
+        if key is None:
+          key = text
+        if key in seen:
+          continue
+        idle = 0
+        seen.add(key)
+        recent.append(key)
+        if len(recent) > self.memory:
+          seen.discard(recent.popleft())
+        yield text
+
+  def _read_and_scroll(self, actor, container):
+    enter_frames(actor, self.locator.frame_path)
+    driver = browser(actor)
+    strategies = self.strategies(actor)
+    return profile_script(actor, [self.locator],
+      lambda: driver.execute_script(READ_AND_SCROLL_JS, strategies, self.key, container))
+
+  def __str__(self):
+    return f'text stream of {self.locator}'
+
+
 # --------------------------------------------------------------------------------
 # Question: ValueAttributeOf
 # --------------------------------------------------------------------------------
@@ -623,6 +1859,54 @@ class ValueAttributeOf(HtmlAttributeOf):
     super().__init__(locator, 'value')
 
 
+# --------------------------------------------------------------------------------
+# Task: WaitForNewWindow
+# --------------------------------------------------------------------------------
+
+# Waits for a window that is not among the known handles and switches to it.
+# Without known handles, the actor's cached handles are used, so ask for
+# WindowHandles before the interaction that opens the window.
+
+class WaitForNewWindow(Task):
+
+  def __init__(self, known=None, timeout=30, switch=True):
+    self.known = known
+    self.timeout = timeout
+    self.switch = switch
+
+  def perform_as(self, actor):
+    known = self.known if self.known is not None else list(window_handles(actor))
+    question = NewWindowHandles(known)
+    new_handles = actor.attempts_to(WaitUntil(question, IsNotEqualTo([]), self.timeout))
+    browsing_context(actor).add_handles(known + new_handles)
+    if self.switch:
+      actor.attempts_to(SwitchToWindow(new_handles[0]))
+    return new_handles[0]
+
+  def __str__(self):
+    return f'wait for a new window'
+
+
+# --------------------------------------------------------------------------------
+# Task: WaitUntilDocumentReady
+# --------------------------------------------------------------------------------
+
+class WaitUntilDocumentReady(WaitUntil):
+
+  def __init__(self, timeout=30, interval=0.1):
+    super().__init__(DocumentReadyState(), IsEqualTo('complete'), timeout, interval)
+
+
+# --------------------------------------------------------------------------------
+# Task: WaitUntilPageIsIdle
+# --------------------------------------------------------------------------------
+
+class WaitUntilPageIsIdle(WaitUntil):
+
+  def __init__(self, quiet=0.5, timeout=30, interval=0.1):
+    super().__init__(PageIsIdle(quiet), IsTrue(), timeout, interval)
+
+
 # --------------------------------------------------------------------------------
 # Question: WindowHandles
 # --------------------------------------------------------------------------------
@@ -630,7 +1914,37 @@ class ValueAttributeOf(HtmlAttributeOf):
 class WindowHandles(Question):
 
   def request_as(self, actor):
-    return actor.using('webdriver').window_handles
+    handles = list(browser(actor).window_handles)
+    browsing_context(actor).handles = handles
+    return handles
 
   def __str__(self):
     return f'window handles'
+
+
+# --------------------------------------------------------------------------------
+# Task: WithBrowserLogs
+# --------------------------------------------------------------------------------
+
+# Performs interactions in order like Sequence.
+# If one fails, the browser logs collected so far are logged
+# and attached to the exception as its browser_logs attribute.
+
+class WithBrowserLogs(Task):
+
+  def __init__(self, *interactions):
+    self.interactions = interactions
+
+  def perform_as(self, actor):
+    try:
+      return [actor.calls(i) for i in self.interactions]
+    except Exception as e:
+      collector = actor.using('browser_logs')
+      collector.drain_quietly()
+      e.browser_logs = collector.entries()
+      for entry in e.browser_logs:
+        logger.error(f'{actor} browser log: {entry.get("level")} {entry.get("message")}')
+      raise
+
+  def __str__(self):
+    return f'do with browser logs: {", ".join(str(i) for i in self.interactions)}'
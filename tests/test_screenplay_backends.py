@@ -0,0 +1,155 @@
+"""
+Contains unit tests for the screenplay.backends module.
+"""
+
+# --------------------------------------------------------------------------------
+# Imports
+# --------------------------------------------------------------------------------
+
+import pytest
+
+from screenplay.backends import Backend
+from screenplay.core import Actor
+from screenplay.locators import Locator
+from screenplay.webdriver import Click, FillForm, HoverOver, QuitBrowser, SelectByText
+
+
+# --------------------------------------------------------------------------------
+# Globals
+# --------------------------------------------------------------------------------
+
+BUTTON = Locator('button', 'id', 'go')
+
+
+# --------------------------------------------------------------------------------
+# Backends for Testing
+# --------------------------------------------------------------------------------
+
+class PartialBackend(Backend):
+
+  def find_element(self, qtype, query):
+    return (qtype, query)
+
+
+class Element:
+
+  def __init__(self, backend, name):
+    self.backend = backend
+    self.name = name
+
+  def is_displayed(self):
+    return True
+
+  def select_by_visible_text(self, text):
+    self.backend.calls.append(('select_by_visible_text', self.name, text))
+
+
+class RecordingBackend(PartialBackend):
+
+  def __init__(self):
+    self.calls = []
+    self.script_answer = None
+
+  def find_element(self, qtype, query):
+    return Element(self, query)
+
+  def find_elements(self, qtype, query):
+    return [(qtype, query)]
+
+  def execute_script(self, script, *args):
+    self.calls.append(('execute_script', script, args))
+    return self.script_answer
+
+  def get(self, url):
+    self.calls.append(('get', url))
+
+  def refresh(self):
+    self.calls.append(('refresh',))
+
+  @property
+  def current_url(self):
+    return 'http://localhost'
+
+  @property
+  def title(self):
+    return 'Home'
+
+  def hover(self, element):
+    self.calls.append(('hover', element))
+
+  def pointer_click(self, element):
+    self.calls.append(('pointer_click', element))
+
+  def type_into(self, elements_and_keys):
+    self.calls.append(('type_into', list(elements_and_keys)))
+
+  def select(self, element):
+    self.calls.append(('select', element.name))
+    return element
+
+  def quit(self):
+    self.calls.append(('quit',))
+
+
+# --------------------------------------------------------------------------------
+# Tests
+# --------------------------------------------------------------------------------
+
+def test_backend_requires_the_whole_protocol():
+  with pytest.raises(TypeError):
+    PartialBackend()
+
+
+def test_backend_implementing_the_protocol():
+  backend = RecordingBackend()
+  backend.get('http://localhost')
+  backend.type_into(zip(['a', 'b'], ['1', '2']))
+  assert isinstance(backend, Backend)
+  assert backend.find_elements('id', 'go') == [('id', 'go')]
+  assert backend.calls == [('get', 'http://localhost'), ('type_into', [('a', '1'), ('b', '2')])]
+
+
+# --------------------------------------------------------------------------------
+# Tests: Interactions through a Backend
+# --------------------------------------------------------------------------------
+
+@pytest.fixture
+def backend():
+  return RecordingBackend()
+
+
+@pytest.fixture
+def actor(backend):
+  actor = Actor()
+  actor.can_use(webdriver=backend)
+  return actor
+
+
+def called(backend):
+  return [(c[0],) + tuple(getattr(a, 'name', a) for a in c[1:]) for c in backend.calls if c[0] != 'execute_script']
+
+
+def test_click_uses_a_pointer_click(actor, backend):
+  actor.attempts_to(Click(BUTTON))
+  assert called(backend) == [('pointer_click', 'go')]
+
+
+def test_hover_over_uses_hover(actor, backend):
+  actor.attempts_to(HoverOver(BUTTON))
+  assert called(backend) == [('hover', 'go')]
+
+
+def test_select_uses_select(actor, backend):
+  actor.attempts_to(SelectByText(Locator('size', 'id', 'size'), 'Large'))
+  assert called(backend) == [('select', 'size'), ('select_by_visible_text', 'size', 'Large')]
+
+
+def test_fill_form_with_the_keyboard_uses_type_into(actor, backend):
+  backend.script_answer = ['email element']
+  actor.attempts_to(FillForm({Locator('email', 'id', 'email'): 'me@example.com'}, keyboard=True))
+  assert called(backend) == [('type_into', [('email element', 'me@example.com')])]
+
+
+def test_quit_browser_uses_quit(actor, backend):
+  actor.attempts_to(QuitBrowser())
+  assert called(backend) == [('quit',)]
@@ -0,0 +1,138 @@
+"""
+Contains unit tests for the screenplay.caching module.
+"""
+
+# --------------------------------------------------------------------------------
+# Imports
+# --------------------------------------------------------------------------------
+
+import os
+import pytest
+import threading
+import time
+
+from screenplay.caching import ExpiringJsonFileCache, JsonFileCache
+
+
+# --------------------------------------------------------------------------------
+# Fixtures
+# --------------------------------------------------------------------------------
+
+@pytest.fixture
+def cache_path(tmp_path):
+  return str(tmp_path / 'cache.json')
+
+
+# --------------------------------------------------------------------------------
+# Tests: JsonFileCache
+# --------------------------------------------------------------------------------
+
+def test_cache_starts_empty_without_a_file(cache_path):
+  cache = JsonFileCache(cache_path)
+  assert len(cache) == 0
+  assert cache.get('key') is None
+  assert cache.get('key', 'default') == 'default'
+
+
+def test_cache_sets_and_gets_values(cache_path):
+  cache = JsonFileCache(cache_path)
+  cache.set('key', {'a': 1})
+  assert 'key' in cache
+  assert cache.get('key') == {'a': 1}
+
+
+def test_cache_deletes_values(cache_path):
+  cache = JsonFileCache(cache_path)
+  cache.set('key', 1)
+  cache.delete('key')
+  assert 'key' not in cache
+
+
+def test_cache_persists_values_across_instances(cache_path):
+  cache = JsonFileCache(cache_path)
+  cache.set('key', [1, 2, 3])
+  cache.save()
+  assert JsonFileCache(cache_path).get('key') == [1, 2, 3]
+
+
+def test_cache_does_not_write_without_changes(cache_path, tmp_path):
+  JsonFileCache(cache_path).save()
+  assert not (tmp_path / 'cache.json').exists()
+
+
+def test_cache_merges_entries_saved_by_other_instances(cache_path):
+  first, second = JsonFileCache(cache_path), JsonFileCache(cache_path)
+  first.set('first', 1)
+  second.set('second', 2)
+  first.save()
+  second.save()
+  assert JsonFileCache(cache_path).get('first') == 1
+  assert second.get('first') == 1
+
+
+def test_cache_merges_deletions(cache_path):
+  cache = JsonFileCache(cache_path)
+  cache.set('old', 1)
+  cache.set('kept', 2)
+  cache.save()
+
+  other = JsonFileCache(cache_path)
+  other.delete('old')
+  cache.set('new', 3)
+  other.save()
+  cache.save()
+  loaded = JsonFileCache(cache_path)
+  assert 'old' not in loaded
+  assert loaded.get('kept') == 2
+  assert loaded.get('new') == 3
+
+
+def test_cache_instances_save_concurrently(cache_path, tmp_path):
+  def write(name):
+    cache = JsonFileCache(cache_path)
+    for i in range(20):
+      cache.set(f'{name} {i}', i)
+      cache.save()
+
+  threads = [threading.Thread(target=write, args=(n,)) for n in 'abcd']
+  for thread in threads:
+    thread.start()
+  for thread in threads:
+    thread.join()
+  assert os.listdir(tmp_path) == ['cache.json']
+  assert len(JsonFileCache(cache_path)) > 0
+
+
+def test_cache_ignores_an_unreadable_file(cache_path, tmp_path):
+  (tmp_path / 'cache.json').write_text('not json')
+  assert len(JsonFileCache(cache_path)) == 0
+
+
+# --------------------------------------------------------------------------------
+# Tests: ExpiringJsonFileCache
+# --------------------------------------------------------------------------------
+
+def test_expiring_cache_fetches_a_stored_value(cache_path):
+  cache = ExpiringJsonFileCache(cache_path)
+  cache.store('admin', {'cookies': []})
+  assert cache.fetch('admin') == {'cookies': []}
+  assert cache.fetch('admin', max_age=60) == {'cookies': []}
+
+
+def test_expiring_cache_fetches_nothing_for_a_missing_key(cache_path):
+  assert ExpiringJsonFileCache(cache_path).fetch('admin') is None
+
+
+def test_expiring_cache_drops_expired_values(cache_path, mocker):
+  cache = ExpiringJsonFileCache(cache_path)
+  cache.store('admin', 'state')
+  mocker.patch('time.time', return_value=time.time() + 120)
+  assert cache.fetch('admin', max_age=60) is None
+  assert 'admin' not in cache
+
+
+def test_expiring_cache_persists_values_across_instances(cache_path):
+  cache = ExpiringJsonFileCache(cache_path)
+  cache.store('admin', 'state')
+  cache.save()
+  assert ExpiringJsonFileCache(cache_path).fetch('admin', max_age=60) == 'state'
@@ -0,0 +1,181 @@
+"""
+Contains unit tests for the screenplay.composite module.
+"""
+
+# --------------------------------------------------------------------------------
+# Imports
+# --------------------------------------------------------------------------------
+
+import pytest
+import threading
+import time
+
+from screenplay.caching import ExpiringJsonFileCache
+from screenplay.composite import CachedSetup, Gather, Sequence
+from screenplay.core import Actor, Question, Task
+
+
+# --------------------------------------------------------------------------------
+# Fixtures
+# --------------------------------------------------------------------------------
+
+@pytest.fixture
+def log():
+  return Log()
+
+
+@pytest.fixture
+def actor(log):
+  actor = Actor(thread_safe=True)
+  actor.can_use(log=log)
+  return actor
+
+
+@pytest.fixture
+def setup_cache(tmp_path):
+  return ExpiringJsonFileCache(str(tmp_path / 'setup.json'))
+
+
+# --------------------------------------------------------------------------------
+# Interactions for Testing
+# --------------------------------------------------------------------------------
+
+class Log:
+
+  def __init__(self):
+    self.entries = []
+
+  def add(self, entry):
+    self.entries.append(entry)
+
+  def count(self):
+    return len(self.entries)
+
+
+class Record(Task):
+
+  def __init__(self, entry):
+    self.entry = entry
+
+  def perform_as(self, actor):
+    actor.using('log').add(self.entry)
+
+
+class Entries(Question):
+
+  def request_as(self, actor):
+    return actor.using('log').count()
+
+
+class MeetAt(Question):
+
+  def __init__(self, barrier, answer):
+    self.barrier = barrier
+    self.answer = answer
+
+  def request_as(self, actor):
+    # only passes if every question is running at the same time
+    self.barrier.wait(timeout=5)
+    return self.answer
+
+
+class RemainingTime(Question):
+
+  def request_as(self, actor):
+    return actor.remaining_time()
+
+
+class Fail(Question):
+
+  def request_as(self, actor):
+    raise ValueError('failed')
+
+
+# --------------------------------------------------------------------------------
+# Tests: Sequence
+# --------------------------------------------------------------------------------
+
+def test_sequence_calls_interactions_in_order(actor, log):
+  answers = actor.attempts_to(Sequence(Record('a'), Entries(), Record('b'), Entries()))
+  assert answers == [None, 1, None, 2]
+  assert log.entries == ['a', 'b']
+
+
+def test_sequence_stops_at_a_failure(actor, log):
+  with pytest.raises(ValueError):
+    actor.attempts_to(Sequence(Record('a'), Fail(), Record('b')))
+  assert log.entries == ['a']
+
+
+# --------------------------------------------------------------------------------
+# Tests: Gather
+# --------------------------------------------------------------------------------
+
+def test_gather_asks_questions_concurrently(actor):
+  barrier = threading.Barrier(3)
+  answers = actor.asks_for(Gather(*[MeetAt(barrier, i) for i in range(3)]))
+  assert answers == [0, 1, 2]
+
+
+def test_gather_with_one_question(actor):
+  assert actor.asks_for(Gather(Entries())) == [0]
+
+
+def test_gather_raises_a_failure(actor):
+  with pytest.raises(ValueError):
+    actor.asks_for(Gather(Entries(), Fail()))
+
+
+def test_gather_inside_a_sequence(actor):
+  answers = actor.attempts_to(Sequence(Record('a'), Gather(Entries(), Entries())))
+  assert answers == [None, [1, 1]]
+
+
+def test_gather_shares_the_time_budget(actor):
+  with actor.within(10):
+    answers = actor.asks_for(Gather(RemainingTime(), RemainingTime()))
+  assert all(0 < a <= 10 for a in answers)
+
+
+# --------------------------------------------------------------------------------
+# Tests: CachedSetup
+# --------------------------------------------------------------------------------
+
+def test_cached_setup_performs_the_task_the_first_time(actor, log, setup_cache):
+  actor.can_use(setup_cache=setup_cache)
+  assert actor.attempts_to(CachedSetup(Record('setup'), 'setup', Entries()))
+  assert log.entries == ['setup']
+  assert setup_cache.fetch('setup') == 1
+
+
+def test_cached_setup_skips_the_task_while_the_fingerprint_matches(actor, log, setup_cache):
+  actor.can_use(setup_cache=setup_cache)
+  actor.attempts_to(CachedSetup(Record('setup'), 'setup', Entries()))
+  assert not actor.attempts_to(CachedSetup(Record('setup'), 'setup', Entries()))
+  assert log.entries == ['setup']
+
+
+def test_cached_setup_repeats_the_task_when_the_fingerprint_changes(actor, log, setup_cache):
+  actor.can_use(setup_cache=setup_cache)
+  actor.attempts_to(CachedSetup(Record('setup'), 'setup', Entries()))
+  log.add('other')
+  assert actor.attempts_to(CachedSetup(Record('setup'), 'setup', Entries()))
+  assert log.entries == ['setup', 'other', 'setup']
+  assert setup_cache.fetch('setup') == 3
+
+
+def test_cached_setup_repeats_the_task_when_expired(actor, log, setup_cache, mocker):
+  actor.can_use(setup_cache=setup_cache)
+  actor.attempts_to(CachedSetup(Record('setup'), 'setup', Entries(), max_age=60))
+  log.entries.clear()
+  mocker.patch('time.time', return_value=time.time() + 61)
+  assert actor.attempts_to(CachedSetup(Record('setup'), 'setup', Entries(), max_age=60))
+
+
+def test_cached_setup_persists_fingerprints_across_runs(actor, log, setup_cache):
+  actor.can_use(setup_cache=setup_cache)
+  actor.attempts_to(CachedSetup(Record('setup'), 'setup', Entries()))
+
+  actor.can_use(setup_cache=ExpiringJsonFileCache(setup_cache.path))
+  assert not actor.attempts_to(CachedSetup(Record('setup'), 'setup', Entries()))
+  assert log.entries == ['setup']
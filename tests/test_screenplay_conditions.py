@@ -6,7 +6,10 @@ Contains unit tests for the screenplay.conditions module.
 # Imports
 # --------------------------------------------------------------------------------
 
+import pytest
+
 from screenplay.conditions import *   # pylint: disable=unused-wildcard-import
+from screenplay.conditions import VECTORIZE_THRESHOLD, vectorize
 
 
 # --------------------------------------------------------------------------------
@@ -163,3 +166,103 @@ def test_DoesNotContain_true_for_dicts():
 
 def test_DoesNotContain_false_for_dicts():
   assert not DoesNotContain("a").evaluate(dict(a=1, b=2, c=3))
+
+
+# --------------------------------------------------------------------------------
+# Tests for Collection Conditions
+# --------------------------------------------------------------------------------
+
+def test_AllSatisfy_true():
+  assert AllSatisfy(IsGreaterThan(0)).evaluate([1, 2, 3])
+
+
+def test_AllSatisfy_false():
+  assert not AllSatisfy(IsGreaterThan(1)).evaluate([1, 2, 3])
+
+
+def test_AllSatisfy_true_for_empty_lists():
+  assert AllSatisfy(IsGreaterThan(1)).evaluate([])
+
+
+def test_AnySatisfy_true():
+  assert AnySatisfy(Contains('lo')).evaluate(['Hello', 'World'])
+
+
+def test_AnySatisfy_false():
+  assert not AnySatisfy(Contains('bye')).evaluate(['Hello', 'World'])
+
+
+def test_CountSatisfying_true():
+  assert CountSatisfying(IsGreaterThan(1), IsEqualTo(2)).evaluate([1, 2, 3])
+
+
+def test_CountSatisfying_false():
+  assert not CountSatisfying(IsGreaterThan(1), IsGreaterThan(2)).evaluate([1, 2, 3])
+
+
+def test_IsSorted_true():
+  assert IsSorted().evaluate(['a', 'b', 'b', 'c'])
+
+
+def test_IsSorted_false():
+  assert not IsSorted().evaluate(['a', 'c', 'b'])
+
+
+def test_IsSorted_true_in_reverse():
+  assert IsSorted(reverse=True).evaluate([3, 2, 2, 1])
+
+
+def test_IsSorted_true_with_key():
+  assert IsSorted(key=str.lower).evaluate(['apple', 'Banana', 'cherry'])
+
+
+def test_IsSorted_with_a_generator():
+  assert IsSorted().evaluate(x for x in [1, 2, 3, 4])
+  assert not IsSorted().evaluate(x for x in [1, 3, 2, 4])
+
+
+def test_MatchesRegexAll_true():
+  assert MatchesRegexAll(r'^\$\d+\.\d{2}$').evaluate(['$1.00', '$25.50'])
+
+
+def test_MatchesRegexAll_false():
+  assert not MatchesRegexAll(r'^\$\d+\.\d{2}$').evaluate(['$1.00', '25.50'])
+
+
+def test_AllSatisfy_vectorized_for_large_numeric_lists():
+  pytest.importorskip('numpy')
+  values = list(range(VECTORIZE_THRESHOLD * 2))
+  assert vectorize(IsGreaterThanOrEqualTo(0), values) is not None
+  assert AllSatisfy(IsGreaterThanOrEqualTo(0)).evaluate(values)
+  assert not AllSatisfy(IsGreaterThan(0)).evaluate(values)
+  assert AnySatisfy(IsEqualTo(5)).evaluate(values)
+  assert CountSatisfying(IsLessThan(10), IsEqualTo(10)).evaluate(values)
+
+
+def test_collection_conditions_compare_nested_lists_as_items():
+  pytest.importorskip('numpy')
+  rows = [[x, x + 1] for x in range(VECTORIZE_THRESHOLD)]
+  assert vectorize(IsEqualTo([3, 9]), rows) is None
+  assert not AnySatisfy(IsEqualTo([3, 9])).evaluate(rows)
+  assert CountSatisfying(IsEqualTo([1, 2]), IsEqualTo(1)).evaluate(rows)
+
+
+def test_collection_conditions_compare_ragged_lists_as_items():
+  pytest.importorskip('numpy')
+  rows = [[1], [1, 2]] * (VECTORIZE_THRESHOLD // 2)
+  assert vectorize(IsEqualTo([1]), rows) is None
+  assert not AllSatisfy(IsEqualTo([1])).evaluate(rows)
+  assert CountSatisfying(IsEqualTo([1]), IsEqualTo(VECTORIZE_THRESHOLD // 2)).evaluate(rows)
+
+
+def test_collection_conditions_compare_list_values_as_items():
+  pytest.importorskip('numpy')
+  values = [1, 2] * (VECTORIZE_THRESHOLD // 2)
+  assert vectorize(IsEqualTo([1, 2]), values) is None
+  assert not AnySatisfy(IsEqualTo([1, 2])).evaluate(values)
+
+
+def test_vectorize_skips_small_and_non_numeric_lists():
+  assert vectorize(IsGreaterThan(0), [1, 2, 3]) is None
+  assert vectorize(IsGreaterThan('a'), ['b'] * VECTORIZE_THRESHOLD) is None
+  assert vectorize(Contains(1), [[1]] * VECTORIZE_THRESHOLD) is None
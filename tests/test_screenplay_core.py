@@ -7,8 +7,11 @@ Contains unit tests for the screenplay.core module.
 # --------------------------------------------------------------------------------
 
 import pytest
+import threading
+import time
 
-from screenplay.core import Actor, Task, Question, MissingAbilityException
+from screenplay.core import Actor, Task, Question, LazyAbility
+from screenplay.core import DeadlineExceededException, MissingAbilityException, ScreenplayException
 
 
 # --------------------------------------------------------------------------------
@@ -76,6 +79,232 @@ def test_actor_using_a_missing_ability_raises_an_exception(actor):
   assert str(e.value) == 'The actor "Actor" does not have an ability named "thing"'
 
 
+# --------------------------------------------------------------------------------
+# Tests: LazyAbility
+# --------------------------------------------------------------------------------
+
+class Factory:
+
+  def __init__(self, value='tool'):
+    self.value = value
+    self.calls = 0
+    self.torn_down = []
+
+  def build(self):
+    self.calls += 1
+    return self.value
+
+  def teardown(self, value):
+    self.torn_down.append(value)
+
+
+def test_actor_lazy_ability_is_not_constructed_until_used(actor):
+  factory = Factory()
+  actor.can_use(thing=LazyAbility(factory.build))
+  assert actor.has('thing')
+  assert factory.calls == 0
+  assert actor.ability_timings == {}
+
+
+def test_actor_lazy_ability_is_constructed_once(actor):
+  factory = Factory()
+  actor.can_use(thing=LazyAbility(factory.build))
+  assert actor.using('thing') == 'tool'
+  assert actor.using('thing') == 'tool'
+  assert factory.calls == 1
+  assert actor.ability_timings['thing'] >= 0
+
+
+def test_actor_lazy_ability_is_constructed_once_across_threads(actor):
+  factory = Factory()
+  actor.can_use(thing=LazyAbility(factory.build))
+  threads = [threading.Thread(target=actor.using, args=('thing',)) for _ in range(8)]
+  for thread in threads:
+    thread.start()
+  for thread in threads:
+    thread.join()
+  assert factory.calls == 1
+
+
+def test_actor_exit_tears_down_constructed_abilities():
+  used = Factory('used')
+  unused = Factory('unused')
+  with Actor() as actor:
+    actor.can_use(
+      used=LazyAbility(used.build, teardown=used.teardown),
+      unused=LazyAbility(unused.build, teardown=unused.teardown))
+    actor.using('used')
+  assert used.torn_down == ['used']
+  assert unused.calls == 0
+  assert unused.torn_down == []
+
+
+def test_actor_exit_continues_after_a_failed_teardown():
+  def fail(value):
+    raise RuntimeError(value)
+  factory = Factory()
+  with Actor() as actor:
+    actor.can_use(
+      thing=LazyAbility(factory.build, teardown=factory.teardown),
+      broken=LazyAbility(factory.build, teardown=fail))
+    actor.using('thing')
+    actor.using('broken')
+  assert factory.torn_down == ['tool']
+
+
+def test_actor_lazy_ability_cannot_be_used_after_exit():
+  factory = Factory()
+  with Actor() as actor:
+    actor.can_use(thing=LazyAbility(factory.build, teardown=factory.teardown))
+    actor.using('thing')
+  with pytest.raises(ScreenplayException):
+    actor.using('thing')
+  assert factory.calls == 1
+
+
+def test_actor_exit_does_not_rebuild_abilities_used_by_teardowns():
+  browser = Factory('browser')
+  with Actor() as actor:
+    actor.can_use(
+      logs=LazyAbility(lambda: 'logs', teardown=lambda value: actor.using('browser')),
+      browser=LazyAbility(browser.build, teardown=browser.teardown))
+    actor.using('logs')
+    actor.using('browser')
+  assert browser.calls == 1
+  assert browser.torn_down == ['browser']
+
+
+# --------------------------------------------------------------------------------
+# Tests: Thread-Safe Actor
+# --------------------------------------------------------------------------------
+
+class Browser:
+
+  def __init__(self):
+    self.active = 0
+    self.overlaps = 0
+    self.url = None
+
+  def command(self):
+    self.active += 1
+    if self.active > 1:
+      self.overlaps += 1
+    time.sleep(0.001)
+    self.active -= 1
+
+  def find_element(self):
+    return Element(self)
+
+  def find_elements(self):
+    return [Element(self), Element(self)]
+
+  def cookies(self):
+    return [{'name': 'session'}]
+
+
+class Element:
+
+  def __init__(self, browser):
+    self.browser = browser
+
+  def click(self):
+    self.browser.command()
+
+
+def run_in_threads(target, count=4):
+  threads = [threading.Thread(target=target) for _ in range(count)]
+  for thread in threads:
+    thread.start()
+  for thread in threads:
+    thread.join()
+
+
+def test_thread_safe_actor_returns_immutable_abilities_directly():
+  actor = Actor(thread_safe=True)
+  actor.can_use(url='http://localhost', retries=3)
+  assert actor.using('url') == 'http://localhost'
+  assert actor.using('retries') == 3
+
+
+def test_thread_safe_actor_serializes_ability_calls():
+  browser = Browser()
+  actor = Actor(thread_safe=True)
+  actor.can_use(browser=browser)
+  run_in_threads(lambda: [actor.using('browser').command() for _ in range(10)])
+  assert browser.overlaps == 0
+
+
+def test_thread_safe_actor_forwards_attribute_writes():
+  browser = Browser()
+  actor = Actor(thread_safe=True)
+  actor.can_use(browser=browser)
+  actor.using('browser').url = 'http://localhost'
+  assert browser.url == 'http://localhost'
+  assert actor.using('browser').url == 'http://localhost'
+
+
+def test_thread_safe_actor_abilities_keep_their_type():
+  actor = Actor(thread_safe=True)
+  actor.can_use(browser=Browser())
+  assert isinstance(actor.using('browser'), Browser)
+
+
+def test_thread_safe_actor_uses_an_ability_exclusively():
+  browser = Browser()
+  actor = Actor(thread_safe=True)
+  actor.can_use(browser=browser)
+
+  def use_twice():
+    with actor.exclusively('browser') as raw:
+      assert raw is browser
+      raw.command()
+      raw.command()
+
+  run_in_threads(use_twice)
+  assert browser.overlaps == 0
+
+
+def test_thread_safe_actor_serializes_calls_on_returned_objects():
+  browser = Browser()
+  actor = Actor(thread_safe=True)
+  actor.can_use(browser=browser)
+
+  def click_elements():
+    elements = [actor.using('browser').find_element()] + actor.using('browser').find_elements()
+    for element in elements:
+      element.click()
+
+  def use_exclusively():
+    with actor.exclusively('browser') as raw:
+      raw.command()
+      raw.command()
+
+  run_in_threads(click_elements)
+  run_in_threads(lambda: (click_elements(), use_exclusively()))
+  assert browser.overlaps == 0
+
+
+def test_thread_safe_actor_returns_builtin_values_directly():
+  actor = Actor(thread_safe=True)
+  actor.can_use(browser=Browser())
+  cookies = actor.using('browser').cookies()
+  assert cookies[0]['name'] == 'session'
+  assert type(cookies[0]) is dict
+  assert isinstance(actor.using('browser').find_element(), Element)
+
+
+def test_actor_local_context_is_per_thread(actor):
+  actor.local.value = 'main'
+  seen = []
+
+  def read():
+    seen.append(getattr(actor.local, 'value', None))
+
+  run_in_threads(read, count=1)
+  assert seen == [None]
+  assert actor.local.value == 'main'
+
+
 # --------------------------------------------------------------------------------
 # Tests: Task
 # --------------------------------------------------------------------------------
@@ -181,3 +410,46 @@ def test_actor_calls_a_question_that_uses_an_ability(actor):
 def test_actor_calls_a_question_but_lacks_the_ability(actor):
   with pytest.raises(MissingAbilityException):
     actor.calls(AddingOneToStart())
+
+
+# --------------------------------------------------------------------------------
+# Tests: Deadlines
+# --------------------------------------------------------------------------------
+
+def test_actor_without_a_budget_has_no_remaining_time(actor):
+  assert actor.remaining_time() is None
+
+
+def test_actor_within_a_budget_has_remaining_time(actor):
+  with actor.within(10):
+    assert 0 < actor.remaining_time() <= 10
+  assert actor.remaining_time() is None
+
+
+def test_actor_nested_budget_cannot_extend_the_outer_budget(actor):
+  with actor.within(1):
+    with actor.within(100):
+      assert actor.remaining_time() <= 1
+
+
+def test_actor_nested_budget_can_shorten_the_outer_budget(actor):
+  with actor.within(100):
+    with actor.within(1):
+      assert actor.remaining_time() <= 1
+    assert actor.remaining_time() > 1
+
+
+def test_actor_fails_fast_when_the_budget_is_exhausted(actor):
+  with actor.within(0):
+    with pytest.raises(DeadlineExceededException) as e:
+      actor.asks_for(AddingOne(5))
+  assert e.value.actor == actor
+  assert isinstance(e.value.interaction, AddingOne)
+
+
+def test_actor_budget_applies_to_tasks_and_calls(actor):
+  with actor.within(0):
+    with pytest.raises(DeadlineExceededException):
+      actor.attempts_to(AddAnAbility('cool'))
+    with pytest.raises(DeadlineExceededException):
+      actor.calls(AddingOne(5))
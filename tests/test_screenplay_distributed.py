@@ -0,0 +1,214 @@
+"""
+Contains unit tests for the screenplay.distributed module.
+"""
+
+# --------------------------------------------------------------------------------
+# Imports
+# --------------------------------------------------------------------------------
+
+import multiprocessing
+import os
+import pytest
+import time
+
+from screenplay.conditions import IsEqualTo
+from screenplay.core import Actor, DeadlineExceededException, MissingAbilityException, Question, Task
+from screenplay.distributed import RemoteActor, RemoteException, dispatch, serve
+from screenplay.locators import Locator
+from screenplay.waiting import WaitUntil, WaitingException
+
+
+# --------------------------------------------------------------------------------
+# Globals
+# --------------------------------------------------------------------------------
+
+AUTHKEY = b'test'
+
+
+# --------------------------------------------------------------------------------
+# Interactions for Testing
+# --------------------------------------------------------------------------------
+
+def make_actor():
+  actor = Actor(f'Worker {os.getpid()}')
+  actor.can_use(page={'#title': 'Home'})
+  return actor
+
+
+class TextOnPage(Question):
+  def __init__(self, locator):
+    self.locator = locator
+  def request_as(self, actor):
+    return actor.using('page').get(self.locator.query)
+  def __str__(self):
+    return f'text of {self.locator}'
+
+
+class SetText(Task):
+  def __init__(self, locator, text):
+    self.locator = locator
+    self.text = text
+  def perform_as(self, actor):
+    actor.using('page')[self.locator.query] = self.text
+
+
+class ProcessId(Question):
+  def __init__(self, delay=0):
+    self.delay = delay
+  def request_as(self, actor):
+    time.sleep(self.delay)
+    return os.getpid()
+
+
+class MissingAbility(Question):
+  def request_as(self, actor):
+    return actor.using('nothing')
+
+
+class OutOfTime(Task):
+  def perform_as(self, actor):
+    with actor.within(0):
+      actor.attempts_to(Fail())
+
+
+class CustomError(Exception):
+  def __init__(self, message, code):
+    super().__init__(message)
+    self.code = code
+
+
+class FailWithCustomError(Task):
+  def perform_as(self, actor):
+    raise CustomError('failed', 42)
+
+
+class Unanswerable(Question):
+  def request_as(self, actor):
+    return lambda: None
+
+
+class Fail(Task):
+  def perform_as(self, actor):
+    raise ValueError('failed')
+
+
+TITLE = Locator('title', 'css selector', '#title')
+
+
+# --------------------------------------------------------------------------------
+# Fixtures
+# --------------------------------------------------------------------------------
+
+@pytest.fixture
+def addresses(tmp_path):
+  addresses = [str(tmp_path / f'worker{i}.sock') for i in range(2)]
+  context = multiprocessing.get_context('fork')
+  workers = [context.Process(target=serve, args=(a, make_actor, AUTHKEY), daemon=True) for a in addresses]
+  for worker in workers:
+    worker.start()
+  yield addresses
+  for worker in workers:
+    worker.terminate()
+    worker.join()
+
+
+@pytest.fixture
+def remote(addresses):
+  with RemoteActor(addresses[0], AUTHKEY) as remote:
+    yield remote
+
+
+# --------------------------------------------------------------------------------
+# Tests: RemoteActor
+# --------------------------------------------------------------------------------
+
+def test_remote_actor_runs_interactions_in_the_worker(remote):
+  assert remote.asks_for(ProcessId()) != os.getpid()
+
+
+def test_remote_actor_keeps_its_abilities_between_calls(remote):
+  assert remote.asks_for(TextOnPage(TITLE)) == 'Home'
+  remote.attempts_to(SetText(TITLE, 'About'))
+  assert remote.calls(TextOnPage(TITLE)) == 'About'
+
+
+def test_remote_actor_records_timings(remote):
+  remote.asks_for(TextOnPage(TITLE))
+  assert len(remote.timings) == 1
+  assert remote.timings[0][0] == 'text of title'
+  assert remote.timings[0][1] >= 0
+
+
+def test_remote_actor_runs_waits_with_conditions(remote):
+  assert remote.attempts_to(WaitUntil(TextOnPage(TITLE), IsEqualTo('Home'), timeout=1)) == 'Home'
+
+
+def test_remote_actor_raises_picklable_failures(remote):
+  with pytest.raises(ValueError, match='failed'):
+    remote.attempts_to(Fail())
+
+
+def test_remote_actor_raises_waiting_exceptions(remote):
+  with pytest.raises(WaitingException) as error:
+    remote.attempts_to(WaitUntil(TextOnPage(TITLE), IsEqualTo('About'), timeout=0.01))
+  assert error.value.actor.startswith('Worker')
+  assert error.value.condition.value == 'About'
+  assert error.value.history.attempts > 0
+
+
+def test_remote_actor_raises_missing_ability_exceptions(remote):
+  with pytest.raises(MissingAbilityException) as error:
+    remote.asks_for(MissingAbility())
+  assert error.value.ability == 'nothing'
+
+
+def test_remote_actor_raises_deadline_exceptions(remote):
+  with pytest.raises(DeadlineExceededException):
+    remote.attempts_to(OutOfTime())
+
+
+def test_remote_actor_raises_other_failures_as_remote_exceptions(remote):
+  with pytest.raises(RemoteException) as error:
+    remote.attempts_to(FailWithCustomError())
+  assert str(error.value) == 'CustomError: failed'
+  assert 'Traceback' in error.value.details
+
+
+def test_remote_actor_reports_unpicklable_answers(remote):
+  with pytest.raises(RemoteException):
+    remote.asks_for(Unanswerable())
+  assert remote.asks_for(TextOnPage(TITLE)) == 'Home'
+
+
+def test_remote_actors_each_get_their_own_actor(addresses):
+  with RemoteActor(addresses[0], AUTHKEY) as first, RemoteActor(addresses[0], AUTHKEY) as second:
+    first.attempts_to(SetText(TITLE, 'About'))
+    assert second.asks_for(TextOnPage(TITLE)) == 'Home'
+
+
+# --------------------------------------------------------------------------------
+# Tests: dispatch
+# --------------------------------------------------------------------------------
+
+def test_dispatch_uses_every_worker(addresses):
+  actors = [RemoteActor(a, AUTHKEY) for a in addresses]
+  try:
+    answers = dispatch([ProcessId(delay=0.02) for _ in range(20)], actors)
+  finally:
+    for actor in actors:
+      actor.close()
+  assert len(answers) == 20
+  assert os.getpid() not in answers
+  assert len(set(answers)) == 2
+
+
+def test_dispatch_returns_answers_in_order_with_failures(addresses):
+  actors = [RemoteActor(a, AUTHKEY) for a in addresses]
+  try:
+    answers = dispatch([TextOnPage(TITLE), Fail(), TextOnPage(TITLE)], actors)
+  finally:
+    for actor in actors:
+      actor.close()
+  assert answers[0] == 'Home'
+  assert isinstance(answers[1], ValueError)
+  assert answers[2] == 'Home'
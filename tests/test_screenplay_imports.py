@@ -0,0 +1,80 @@
+"""
+Contains unit tests for the screenplay package imports.
+"""
+
+# --------------------------------------------------------------------------------
+# Imports
+# --------------------------------------------------------------------------------
+
+import subprocess
+import sys
+
+
+# --------------------------------------------------------------------------------
+# Helpers
+# --------------------------------------------------------------------------------
+
+def run_python(code):
+  # a fresh interpreter, so that modules imported by other tests do not interfere
+  result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True)
+  assert result.returncode == 0, result.stderr
+  return result.stdout.strip()
+
+
+# --------------------------------------------------------------------------------
+# Tests
+# --------------------------------------------------------------------------------
+
+def test_importing_screenplay_does_not_import_selenium():
+  code = 'import sys, screenplay; print("selenium" in sys.modules)'
+  assert run_python(code) == 'False'
+
+
+def test_importing_core_modules_does_not_import_selenium():
+  code = 'import sys, screenplay.core, screenplay.conditions, screenplay.waiting; ' \
+    'print("selenium" in sys.modules)'
+  assert run_python(code) == 'False'
+
+
+def test_importing_screenplay_does_not_import_numpy():
+  code = 'import sys, screenplay; print("numpy" in sys.modules)'
+  assert run_python(code) == 'False'
+
+
+def test_screenplay_exports_core_names():
+  code = 'from screenplay import Actor, IsTrue, Locator, WaitUntil; print(Actor.__module__)'
+  assert run_python(code) == 'screenplay.core'
+
+
+def test_screenplay_does_not_export_condition_module_internals():
+  code = 'import screenplay; ' \
+    'print([n for n in ("re", "operator", "islice", "ABC", "vectorize") if hasattr(screenplay, n)])'
+  assert run_python(code) == '[]'
+
+
+def test_screenplay_imports_webdriver_names_on_first_access():
+  code = 'import sys, screenplay; print(screenplay.Click.__module__, "selenium" in sys.modules)'
+  assert run_python(code) == 'screenplay.webdriver True'
+
+
+def test_screenplay_imports_the_webdriver_module_on_first_access():
+  code = 'import screenplay; print(screenplay.webdriver.__name__)'
+  assert run_python(code) == 'screenplay.webdriver'
+
+
+def test_screenplay_raises_for_unknown_names():
+  code = 'import screenplay\n' \
+    'try:\n  screenplay.Nothing\nexcept AttributeError as e:\n  print(e)'
+  assert run_python(code) == "module 'screenplay' has no attribute 'Nothing'"
+
+
+def test_screenplay_does_not_import_selenium_for_unknown_names():
+  code = 'import sys, screenplay; print(hasattr(screenplay, "Backend"), "selenium" in sys.modules)'
+  assert run_python(code) == 'False False'
+
+
+def test_screenplay_lists_every_webdriver_name():
+  code = 'import screenplay, screenplay.webdriver as w; ' \
+    'names = {n for n, v in vars(w).items() if getattr(v, "__module__", None) == w.__name__ and n[0] != "_"}; ' \
+    'print(sorted(names ^ set(screenplay.LAZY_NAMES[w.__name__])))'
+  assert run_python(code) == '[]'
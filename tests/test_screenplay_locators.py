@@ -0,0 +1,109 @@
+"""
+Contains unit tests for the screenplay.locators module.
+"""
+
+# --------------------------------------------------------------------------------
+# Imports
+# --------------------------------------------------------------------------------
+
+import pytest
+
+from screenplay.locators import SHADOW_PATH, Locator, LocatorCache, ShadowLocator
+
+
+# --------------------------------------------------------------------------------
+# Globals
+# --------------------------------------------------------------------------------
+
+PAGE = 'http://localhost/search'
+PRIMARY = ('id', 'search')
+NAME = ('name', 'q')
+XPATH = ('xpath', '//input')
+
+
+# --------------------------------------------------------------------------------
+# Fixtures
+# --------------------------------------------------------------------------------
+
+@pytest.fixture
+def locator():
+  return Locator('search input', *PRIMARY, fallbacks=[NAME, XPATH])
+
+
+@pytest.fixture
+def cache(tmp_path):
+  return LocatorCache(str(tmp_path / 'locators.json'))
+
+
+# --------------------------------------------------------------------------------
+# Tests: Locator
+# --------------------------------------------------------------------------------
+
+def test_locator_without_fallbacks_has_one_strategy():
+  locator = Locator('search input', *PRIMARY)
+  assert locator.strategies == (PRIMARY,)
+  assert str(locator) == 'search input'
+  assert repr(locator) == 'id: search'
+
+
+def test_locator_strategies_start_with_the_primary(locator):
+  assert locator.strategies == (PRIMARY, NAME, XPATH)
+
+
+def test_locator_without_a_frame_is_in_the_top_level_document(locator):
+  assert locator.frame_path == ()
+
+
+def test_locator_frame_path_starts_with_the_outermost_frame():
+  outer = Locator('outer frame', 'id', 'outer')
+  inner = Locator('inner frame', 'id', 'inner', frame=outer)
+  button = Locator('button', 'id', 'go', frame=inner)
+  assert inner.frame_path == (outer,)
+  assert button.frame_path == (outer, inner)
+
+
+def test_shadow_locator_uses_a_shadow_path():
+  locator = ShadowLocator('date input', 'app-form', 'date-picker', 'input')
+  assert locator.strategies == ((SHADOW_PATH, ('app-form', 'date-picker', 'input')),)
+  assert repr(locator) == 'shadow path: app-form >>> date-picker >>> input'
+
+
+# --------------------------------------------------------------------------------
+# Tests: LocatorCache
+# --------------------------------------------------------------------------------
+
+def test_cache_order_defaults_to_declared_order(cache, locator):
+  assert cache.order(PAGE, locator) == [PRIMARY, NAME, XPATH]
+
+
+def test_cache_order_puts_known_good_strategies_first(cache, locator):
+  cache.record_success(PAGE, locator, XPATH, 0.01)
+  assert cache.order(PAGE, locator) == [XPATH, PRIMARY, NAME]
+
+
+def test_cache_order_puts_the_fastest_strategy_first(cache, locator):
+  cache.record_success(PAGE, locator, XPATH, 0.05)
+  cache.record_success(PAGE, locator, NAME, 0.01)
+  assert cache.order(PAGE, locator) == [NAME, XPATH, PRIMARY]
+
+
+def test_cache_order_forgets_failed_strategies(cache, locator):
+  cache.record_success(PAGE, locator, XPATH, 0.01)
+  cache.record_failure(PAGE, locator, XPATH)
+  assert cache.order(PAGE, locator) == [PRIMARY, NAME, XPATH]
+
+
+def test_cache_order_ignores_query_and_fragment(cache, locator):
+  cache.record_success(PAGE + '?q=test#top', locator, NAME, 0.01)
+  assert cache.order(PAGE, locator)[0] == NAME
+
+
+def test_cache_order_is_per_page(cache, locator):
+  cache.record_success(PAGE, locator, NAME, 0.01)
+  assert cache.order('http://localhost/other', locator)[0] == PRIMARY
+
+
+def test_cache_order_persists_across_runs(cache, locator):
+  cache.record_success(PAGE, locator, XPATH, 0.01)
+  cache.save()
+  assert LocatorCache(cache.path).order(PAGE, locator)[0] == XPATH
@@ -0,0 +1,141 @@
+"""
+Contains unit tests for the screenplay.profiling module.
+"""
+
+# --------------------------------------------------------------------------------
+# Imports
+# --------------------------------------------------------------------------------
+
+import pytest
+
+from screenplay.locators import SHADOW_PATH, Locator
+from screenplay.profiling import Instrumentation, LocatorProfiler, TimingStats, percentile
+
+
+# --------------------------------------------------------------------------------
+# Globals
+# --------------------------------------------------------------------------------
+
+BUTTON = Locator('button', 'id', 'go')
+ROWS = Locator('rows', 'xpath', '//table//tr')
+
+
+# --------------------------------------------------------------------------------
+# Fixtures
+# --------------------------------------------------------------------------------
+
+@pytest.fixture
+def profiler():
+  profiler = LocatorProfiler(slow_threshold=0.5)
+  profiler.record(BUTTON, BUTTON.strategies[0], 0.01, polled=True)
+  profiler.record(BUTTON, BUTTON.strategies[0], 0.02, polled=True)
+  profiler.record(BUTTON, BUTTON.strategies[0], 0.03, polled=True)
+  profiler.record(ROWS, ROWS.strategies[0], 0.9)
+  return profiler
+
+
+# --------------------------------------------------------------------------------
+# Tests: percentile
+# --------------------------------------------------------------------------------
+
+def test_percentile_of_empty_values():
+  assert percentile([], 0.5) is None
+
+
+def test_percentile_uses_nearest_rank():
+  values = list(range(1, 101))
+  assert percentile(values, 0.50) == 50
+  assert percentile(values, 0.95) == 95
+  assert percentile(values, 1.0) == 100
+  assert percentile(values, 0.0) == 1
+
+
+# --------------------------------------------------------------------------------
+# Tests: TimingStats
+# --------------------------------------------------------------------------------
+
+def test_timing_stats_summary():
+  stats = TimingStats()
+  for duration in [0.3, 0.1, 0.2]:
+    stats.add(duration)
+  summary = stats.summary()
+  assert summary['count'] == 3
+  assert summary['total'] == pytest.approx(0.6)
+  assert summary['p50'] == 0.2
+  assert summary['max'] == 0.3
+
+
+# --------------------------------------------------------------------------------
+# Tests: Instrumentation
+# --------------------------------------------------------------------------------
+
+def test_instrumentation_records_measurements():
+  instrumentation = Instrumentation()
+  instrumentation.record('page load', 1.0)
+  instrumentation.record('page load', 3.0)
+  summary = instrumentation.summary()['measurements']['page load']
+  assert summary['count'] == 2
+  assert summary['max'] == 3.0
+
+
+def test_instrumentation_counts():
+  instrumentation = Instrumentation()
+  instrumentation.count('polls')
+  instrumentation.count('polls', 4)
+  assert instrumentation.counter('polls') == 5
+  assert instrumentation.counter('other') == 0
+  assert instrumentation.summary()['counters'] == {'polls': 5}
+
+
+def test_instrumentation_reset():
+  instrumentation = Instrumentation()
+  instrumentation.record('page load', 1.0)
+  instrumentation.count('polls')
+  instrumentation.reset()
+  assert instrumentation.summary() == {'measurements': {}, 'counters': {}}
+
+
+# --------------------------------------------------------------------------------
+# Tests: LocatorProfiler
+# --------------------------------------------------------------------------------
+
+def test_profiler_report_ranks_by_total_time(profiler):
+  report = profiler.report()
+  assert [r['name'] for r in report] == ['rows', 'button']
+
+
+def test_profiler_report_flags_slow_xpath_selectors(profiler):
+  rows, button = profiler.report()
+  assert rows['slow'] and rows['xpath']
+  assert not button['slow'] and not button['xpath']
+
+
+def test_profiler_report_aggregates_calls(profiler):
+  button = profiler.report()[1]
+  assert button['count'] == 3
+  assert button['polls'] == 3
+  assert button['p50'] == 0.02
+  assert button['max'] == 0.03
+
+
+def test_profiler_most_polled(profiler):
+  assert [r['name'] for r in profiler.most_polled()] == ['button']
+
+
+def test_profiler_format_report(profiler):
+  lines = profiler.format_report().splitlines()
+  assert len(lines) == 3
+  assert 'SLOW XPATH' in lines[1]
+  assert 'rows (xpath: //table//tr)' in lines[1]
+
+
+def test_profiler_reset(profiler):
+  profiler.reset()
+  assert profiler.report() == []
+
+
+def test_profiler_records_list_queries():
+  profiler = LocatorProfiler()
+  locator = Locator('date input', SHADOW_PATH, ['app-form', 'input'])
+  profiler.record(locator, locator.strategies[0], 0.01)
+  assert profiler.report()[0]['query'] == ('app-form', 'input')
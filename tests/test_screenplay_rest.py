@@ -0,0 +1,122 @@
+"""
+Contains unit tests for the screenplay.rest module.
+"""
+
+# --------------------------------------------------------------------------------
+# Imports
+# --------------------------------------------------------------------------------
+
+import json
+import pytest
+import threading
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from screenplay.conditions import IsEqualTo
+from screenplay.core import Actor
+from screenplay.rest import Delete, Get, Post, ResponseJson, RestApi, StatusCode
+from screenplay.waiting import WaitUntil
+
+
+# --------------------------------------------------------------------------------
+# Stub Server
+# --------------------------------------------------------------------------------
+
+class StubHandler(BaseHTTPRequestHandler):
+
+  protocol_version = 'HTTP/1.1'
+
+  def _reply(self, status, payload):
+    body = json.dumps(payload).encode('utf-8')
+    self.send_response(status)
+    self.send_header('Content-Type', 'application/json')
+    self.send_header('Content-Length', str(len(body)))
+    self.end_headers()
+    self.wfile.write(body)
+
+  def _record(self):
+    self.server.connections.add(self.client_address)
+    self.server.requests.append((self.command, self.path, self.headers.get('X-Token')))
+
+  def do_GET(self):
+    self._record()
+    if self.path.startswith('/ready'):
+      self.server.polls += 1
+      self._reply(200 if self.server.polls >= 3 else 503, {})
+    else:
+      self._reply(200, {'path': self.path})
+
+  def do_POST(self):
+    self._record()
+    length = int(self.headers['Content-Length'])
+    self._reply(201, json.loads(self.rfile.read(length)))
+
+  def do_DELETE(self):
+    self._record()
+    self._reply(204 if self.path == '/items/1' else 404, {})
+
+  def log_message(self, *args):
+    pass
+
+
+@pytest.fixture
+def server():
+  server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+  server.connections = set()
+  server.requests = []
+  server.polls = 0
+  thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+  thread.start()
+  yield server
+  server.shutdown()
+  server.server_close()
+
+
+@pytest.fixture
+def actor(server):
+  host, port = server.server_address
+  api = RestApi(f'http://{host}:{port}/', headers={'X-Token': 'secret'})
+  actor = Actor()
+  actor.can_use(rest_api=api)
+  yield actor
+  api.close()
+
+
+# --------------------------------------------------------------------------------
+# Tests
+# --------------------------------------------------------------------------------
+
+def test_get_answers_a_response(actor):
+  response = actor.attempts_to(Get('/items', params={'page': 2}))
+  assert response.status == 200
+  assert response.json() == {'path': '/items?page=2'}
+
+
+def test_post_sends_json(actor):
+  response = actor.attempts_to(Post('/items', json_body={'name': 'widget'}))
+  assert response.status == 201
+  assert response.json() == {'name': 'widget'}
+
+
+def test_requests_send_default_headers(actor, server):
+  actor.attempts_to(Get('/items'))
+  assert server.requests == [('GET', '/items', 'secret')]
+
+
+def test_status_code(actor):
+  assert actor.asks_for(StatusCode(Delete('/items/1'))) == 204
+  assert actor.asks_for(StatusCode(Delete('/items/2'))) == 404
+
+
+def test_response_json(actor):
+  assert actor.asks_for(ResponseJson(Get('/items/1'))) == {'path': '/items/1'}
+
+
+def test_waiting_for_a_status_code(actor, server):
+  actor.attempts_to(WaitUntil(StatusCode(Get('/ready')), IsEqualTo(200), timeout=5))
+  assert server.polls == 3
+
+
+def test_requests_reuse_one_connection(actor, server):
+  for _ in range(5):
+    actor.attempts_to(Get('/items'))
+  assert len(server.connections) == 1
@@ -10,7 +10,8 @@ import pytest
 import time
 
 from screenplay.conditions import IsEqualTo, IsGreaterThan, IsLessThan
-from screenplay.core import Actor, Task, Question
+from screenplay.core import Actor, Task, Question, DeadlineExceededException
+from screenplay.profiling import Instrumentation
 from screenplay.waiting import WaitUntil, WaitingException
 
 
@@ -46,6 +47,11 @@ class NextCount(Question):
     return COUNTER
 
 
+class WaitingDepth(Question):
+  def request_as(self, actor):
+    return actor.local.waiting
+
+
 # ------------------------------------------------------------------------------
 # Waiting Tests
 # ------------------------------------------------------------------------------
@@ -87,3 +93,97 @@ def test_waiting_failure(actor, mocker):
 
   global COUNTER
   assert COUNTER > 0
+
+
+def test_waiting_marks_the_actor_as_waiting(actor):
+  depth = actor.attempts_to(WaitUntil(WaitingDepth(), IsEqualTo(1), timeout=1))
+  assert depth == 1
+  assert actor.local.waiting == 0
+
+
+def test_waiting_failure_clears_the_waiting_mark(actor, mocker):
+  mocker.patch('time.sleep')
+  with pytest.raises(WaitingException):
+    actor.attempts_to(WaitUntil(WaitingDepth(), IsEqualTo(2), timeout=0.1, interval=0.01))
+  assert actor.local.waiting == 0
+
+
+def test_waiting_is_limited_by_the_time_budget(actor):
+  start = time.monotonic()
+  with actor.within(0.05):
+    with pytest.raises(DeadlineExceededException):
+      actor.attempts_to(WaitUntil(NextCount(), IsLessThan(0), timeout=30, interval=0.01))
+  assert time.monotonic() - start < 1
+
+
+def test_waiting_does_not_sleep_past_the_time_budget(actor):
+  start = time.monotonic()
+  with actor.within(0.05):
+    with pytest.raises(DeadlineExceededException):
+      actor.attempts_to(WaitUntil(NextCount(), IsLessThan(0), timeout=30, interval=1))
+  assert time.monotonic() - start < 0.5
+
+
+def test_waiting_within_a_larger_budget_keeps_its_own_timeout(actor, mocker):
+  mocker.patch('time.sleep')
+  with actor.within(30):
+    with pytest.raises(WaitingException):
+      actor.attempts_to(WaitUntil(NextCount(), IsLessThan(0), timeout=0.1, interval=0.01))
+
+
+class Constant(Question):
+  def __init__(self, value):
+    self.value = value
+  def request_as(self, actor):
+    return self.value
+
+
+# ------------------------------------------------------------------------------
+# Wait History Tests
+# ------------------------------------------------------------------------------
+
+def test_waiting_failure_reports_the_history(actor, mocker):
+  mocker.patch('time.sleep')
+  with pytest.raises(WaitingException) as error:
+    actor.attempts_to(WaitUntil(NextCount(), IsLessThan(0), timeout=0.1, interval=0.01))
+
+  history = error.value.history
+  assert history.attempts == COUNTER
+  assert history.answers[-1][0] == COUNTER
+  assert history.answers[-1][2] == COUNTER
+  assert f'{COUNTER} attempts' in str(error.value)
+
+
+def test_waiting_history_is_bounded(actor, mocker):
+  mocker.patch('time.sleep')
+  with pytest.raises(WaitingException) as error:
+    actor.attempts_to(WaitUntil(NextCount(), IsLessThan(0), timeout=0.1, history_size=3))
+
+  history = error.value.history
+  assert history.attempts > 3
+  assert [a[2] for a in history.answers] == [COUNTER - 2, COUNTER - 1, COUNTER]
+
+
+def test_waiting_history_keeps_only_distinct_answers(actor, mocker):
+  mocker.patch('time.sleep')
+  with pytest.raises(WaitingException) as error:
+    actor.attempts_to(WaitUntil(Constant('loading'), IsEqualTo('done'), timeout=0.05))
+
+  history = error.value.history
+  assert history.attempts > 1
+  assert len(history.answers) == 1
+  assert history.answers[0][0] == 1
+  assert history.answers[0][2] == 'loading'
+
+
+def test_waiting_counts_polls_in_instrumentation(actor, mocker):
+  mocker.patch('time.sleep')
+  actor.can_use(instrumentation=Instrumentation())
+  actor.attempts_to(WaitUntil(NextCount(), IsEqualTo(5), timeout=1))
+
+  with pytest.raises(WaitingException):
+    actor.attempts_to(WaitUntil(NextCount(), IsLessThan(0), timeout=0.05))
+
+  instrumentation = actor.using('instrumentation')
+  assert instrumentation.counter('wait polls') == COUNTER
+  assert instrumentation.summary()['measurements']['wait duration']['count'] == 2
@@ -0,0 +1,935 @@
+"""
+Contains unit tests for the screenplay.webdriver module.
+"""
+
+# --------------------------------------------------------------------------------
+# Imports
+# --------------------------------------------------------------------------------
+
+import pytest
+import threading
+import time
+
+from screenplay.caching import ExpiringJsonFileCache
+from screenplay.core import Actor, LazyAbility, ScreenplayException, Task
+from screenplay.locators import SHADOW_PATH, Locator, LocatorCache, ShadowLocator
+from screenplay.profiling import Instrumentation, LocatorProfiler
+from screenplay.webdriver import BrowserLogCollector, BrowserLogs, JavaScriptErrors, WithBrowserLogs
+from screenplay.conditions import IsEqualTo, IsTrue
+from screenplay.waiting import WaitUntil
+from screenplay.webdriver import NavigateToUrl, PAGE_LOAD_METRICS_JS
+from screenplay.webdriver import RESTORE_STORAGE_JS, RestoreBrowserState, RestoreBrowserStateFrom
+from screenplay.webdriver import PAGE_READINESS_JS, PageIsIdle, WaitUntilDocumentReady, WaitUntilPageIsIdle
+from screenplay.webdriver import Click, ScrollToEnd, SCROLL_INTO_VIEW_JS, SCROLL_TO_END_JS
+from screenplay.webdriver import CloseWindow, NewTab, RefreshBrowser, SwitchToWindow, WaitForNewWindow, WindowHandles
+from screenplay.webdriver import AcceptAlert, AlertPresence, AlertText, DismissAlert, PageReadiness
+from screenplay.backends import Backend
+from screenplay.webdriver import FillForm, SET_FIELD_VALUES_JS, ALL_APPEARED_JS
+from screenplay.webdriver import AppearanceOfAll, CountOf, DocumentReadyState, ExistenceOf, LocatorInteraction, TextStreamOf, browsing_context, enter_frames
+from screenplay.webdriver import COUNT_FIRST_MATCHING_JS, FIND_ALL_JS, FIND_ELEMENT_JS, READ_AND_SCROLL_JS
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import ElementClickInterceptedException, NoAlertPresentException, NoSuchElementException
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.common.exceptions import UnexpectedAlertPresentException, WebDriverException
+
+
+# --------------------------------------------------------------------------------
+# Fakes for Testing
+# --------------------------------------------------------------------------------
+
+class LoggingDriver:
+
+  def __init__(self):
+    self.pending = []
+    self.scripts = []
+    self.failing = False
+
+  def log(self, level, message, source='javascript'):
+    self.pending.append({'level': level, 'message': message, 'source': source, 'timestamp': 0})
+
+  def get_log(self, log_type):
+    if self.failing:
+      raise WebDriverException('browser is gone')
+    entries, self.pending = self.pending, []
+    return entries
+
+  def execute_script(self, script, *args):
+    self.scripts.append(script)
+    return [{'level': 'SEVERE', 'message': 'captured', 'source': 'javascript', 'timestamp': 0}]
+
+
+class Fail(Task):
+  def perform_as(self, actor):
+    raise ValueError('failed')
+
+
+# --------------------------------------------------------------------------------
+# Fixtures
+# --------------------------------------------------------------------------------
+
+@pytest.fixture
+def driver():
+  return LoggingDriver()
+
+
+@pytest.fixture
+def actor(driver):
+  actor = Actor(thread_safe=True)
+  actor.can_use(webdriver=driver)
+  return actor
+
+
+def wait_for(predicate, timeout=2):
+  end = time.monotonic() + timeout
+  while not predicate() and time.monotonic() < end:
+    time.sleep(0.005)
+  return predicate()
+
+
+# --------------------------------------------------------------------------------
+# Tests for BrowserLogCollector
+# --------------------------------------------------------------------------------
+
+def test_collector_drains_in_the_background(actor, driver):
+  collector = BrowserLogCollector(actor, interval=0.01).start()
+  try:
+    driver.log('INFO', 'hello')
+    assert wait_for(lambda: len(collector.entries()) == 1)
+    assert collector.entries()[0]['message'] == 'hello'
+  finally:
+    collector.stop()
+  assert not any(t.name == 'Actor browser logs' for t in threading.enumerate())
+
+
+def test_collector_stop_drains_remaining_entries(actor, driver):
+  collector = BrowserLogCollector(actor, interval=60).start()
+  driver.log('WARNING', 'late')
+  collector.stop()
+  assert [e['message'] for e in collector.entries()] == ['late']
+
+
+def test_collector_buffer_is_bounded(actor, driver):
+  collector = BrowserLogCollector(actor, size=3)
+  for i in range(5):
+    driver.log('INFO', str(i))
+  collector.drain()
+  assert [e['message'] for e in collector.entries()] == ['2', '3', '4']
+
+
+def test_collector_filters_by_level(actor, driver):
+  collector = BrowserLogCollector(actor)
+  driver.log('INFO', 'info')
+  driver.log('SEVERE', 'error')
+  collector.drain()
+  assert [e['message'] for e in collector.entries('SEVERE')] == ['error']
+
+
+def test_collector_captures_errors_with_a_script(actor, driver):
+  collector = BrowserLogCollector(actor, log_type=None, capture_errors=True)
+  collector.drain()
+  assert len(driver.scripts) == 1
+  assert collector.entries()[0]['message'] == 'captured'
+
+
+def test_collector_ignores_webdriver_errors_in_the_background(actor, driver):
+  driver.failing = True
+  collector = BrowserLogCollector(actor, interval=0.01).start()
+  time.sleep(0.05)
+  collector.stop()
+  assert collector.entries() == []
+
+
+def test_collector_requires_a_thread_safe_actor(driver):
+  actor = Actor()
+  actor.can_use(webdriver=driver)
+  with pytest.raises(ScreenplayException):
+    BrowserLogCollector(actor)
+
+
+def test_collector_drains_quietly_after_the_browser_is_closed(driver):
+  with Actor(thread_safe=True) as actor:
+    actor.can_use(webdriver=LazyAbility(lambda: driver))
+    collector = BrowserLogCollector(actor)
+    collector.drain()
+  collector.drain_quietly()
+  assert collector.entries() == []
+
+
+def test_collector_as_lazy_ability_is_stopped_on_exit(driver):
+  with Actor(thread_safe=True) as actor:
+    actor.can_use(webdriver=driver)
+    actor.can_use(browser_logs=LazyAbility(
+      lambda: BrowserLogCollector(actor, interval=60).start(), teardown=BrowserLogCollector.stop))
+    assert actor.asks_for(BrowserLogs()) == []
+    driver.log('INFO', 'bye')
+  assert not any(t.name == 'Actor browser logs' for t in threading.enumerate())
+
+
+# --------------------------------------------------------------------------------
+# Tests for Browser Log Interactions
+# --------------------------------------------------------------------------------
+
+def test_browser_logs(actor, driver):
+  actor.can_use(browser_logs=BrowserLogCollector(actor))
+  driver.log('INFO', 'info')
+  driver.log('SEVERE', 'error')
+  assert [e['message'] for e in actor.asks_for(BrowserLogs())] == ['info', 'error']
+  assert [e['message'] for e in actor.asks_for(BrowserLogs('INFO'))] == ['info']
+
+
+def test_browser_logs_without_draining(actor, driver):
+  actor.can_use(browser_logs=BrowserLogCollector(actor))
+  driver.log('INFO', 'info')
+  assert actor.asks_for(BrowserLogs(fresh=False)) == []
+
+
+def test_javascript_errors(actor, driver):
+  actor.can_use(browser_logs=BrowserLogCollector(actor))
+  driver.log('INFO', 'info')
+  driver.log('SEVERE', 'TypeError: x is undefined')
+  driver.log('SEVERE', 'GET /missing 404', source='network')
+  errors = actor.asks_for(JavaScriptErrors())
+  assert [e['message'] for e in errors] == ['TypeError: x is undefined']
+
+
+def test_with_browser_logs_attaches_logs_on_failure(actor, driver):
+  actor.can_use(browser_logs=BrowserLogCollector(actor))
+  driver.log('SEVERE', 'boom')
+  with pytest.raises(ValueError) as error:
+    actor.attempts_to(WithBrowserLogs(Fail()))
+  assert [e['message'] for e in error.value.browser_logs] == ['boom']
+
+
+# --------------------------------------------------------------------------------
+# Tests for Shadow Locators
+# --------------------------------------------------------------------------------
+
+def test_shadow_locator_lookup_is_profiled(mocker):
+  driver = mocker.Mock()
+  driver.execute_script.return_value = 'element'
+  actor = Actor()
+  actor.can_use(webdriver=driver, locator_profiler=LocatorProfiler())
+  locator = ShadowLocator('date input', 'app-form', 'input')
+
+  assert actor.asks_for(ExistenceOf(locator))
+  driver.execute_script.assert_called_once_with(FIND_ELEMENT_JS, SHADOW_PATH, ('app-form', 'input'))
+  report = actor.using('locator_profiler').report()
+  assert [(r['name'], r['query'], r['count']) for r in report] == [('date input', ('app-form', 'input'), 1)]
+
+
+def test_shadow_locator_missing_element(mocker):
+  driver = mocker.Mock()
+  driver.execute_script.return_value = None
+  actor = Actor()
+  actor.can_use(webdriver=driver, locator_profiler=LocatorProfiler())
+  assert not actor.asks_for(ExistenceOf(ShadowLocator('date input', 'app-form', 'input')))
+
+
+# --------------------------------------------------------------------------------
+# Tests for TextStreamOf
+# --------------------------------------------------------------------------------
+
+ITEMS = Locator('items', 'css selector', 'li')
+
+
+def streaming_actor(mocker, *batches):
+  mocker.patch('time.sleep')
+  driver = mocker.Mock()
+  driver.execute_script.side_effect = list(batches) + [[]] * 10
+  actor = Actor()
+  actor.can_use(webdriver=driver)
+  return actor, driver
+
+
+def test_text_stream_deduplicates_items(mocker):
+  actor, driver = streaming_actor(mocker, [['a', 'A'], ['b', 'B']], [['b', 'B'], ['c', 'C']])
+  assert list(actor.asks_for(TextStreamOf(ITEMS, key='id'))) == ['A', 'B', 'C']
+  driver.execute_script.assert_any_call(READ_AND_SCROLL_JS, ITEMS.strategies, 'id', None)
+
+
+def test_text_stream_keys_items_without_the_attribute_by_text(mocker):
+  actor, _ = streaming_actor(mocker, [['a', 'a'], [None, 'b']], [[None, 'c'], [None, 'd'], ['e', 'e']])
+  assert list(actor.asks_for(TextStreamOf(ITEMS, key='id'))) == ['a', 'b', 'c', 'd', 'e']
+
+
+def test_text_stream_forgets_keys_beyond_its_memory(mocker):
+  actor, _ = streaming_actor(mocker, [['a', 'A'], ['b', 'B']], [['a', 'A']])
+  assert list(actor.asks_for(TextStreamOf(ITEMS, memory=1))) == ['A', 'B', 'A']
+
+
+def test_text_stream_ends_after_idle_scrolls(mocker):
+  actor, driver = streaming_actor(mocker, [['a', 'A']], [['a', 'A']])
+  assert list(actor.asks_for(TextStreamOf(ITEMS, idle_scrolls=2))) == ['A']
+  assert driver.execute_script.call_count == 3
+
+
+def test_text_stream_waits_for_items_loaded_later(mocker):
+  actor, driver = streaming_actor(mocker, [['a', 'A']], [['a', 'A']], [['a', 'A']], [['a', 'A'], ['b', 'B']])
+  assert list(actor.asks_for(TextStreamOf(ITEMS, idle_scrolls=3, interval=0.2))) == ['A', 'B']
+  assert [c[0] for c in time.sleep.call_args_list] == [(0.2,), (0.2,), (0.2,), (0.2,)]   # pylint: disable=no-member
+
+
+def test_text_stream_stops_scrolling_when_closed_early(mocker):
+  actor, driver = streaming_actor(mocker, [['a', 'A'], ['b', 'B']], [['c', 'C']])
+  stream = actor.asks_for(TextStreamOf(ITEMS))
+  assert next(stream) == 'A'
+  stream.close()
+  assert driver.execute_script.call_count == 1
+
+
+# --------------------------------------------------------------------------------
+# Tests for Frames
+# --------------------------------------------------------------------------------
+
+OUTER = Locator('outer frame', 'id', 'outer')
+INNER = Locator('inner frame', 'id', 'inner', frame=OUTER)
+SIDE = Locator('side frame', 'id', 'side')
+BUTTON = Locator('button', 'id', 'go', frame=INNER)
+
+
+@pytest.fixture
+def framed(mocker):
+  driver = mocker.Mock()
+  driver.find_element.side_effect = lambda qtype, query: f'{query} element'
+  actor = Actor()
+  actor.can_use(webdriver=driver)
+  return actor, driver
+
+
+def switches(driver):
+  return [(c[0], c[1]) for c in driver.switch_to.method_calls]
+
+
+def test_enter_frames_from_the_top(framed):
+  actor, driver = framed
+  enter_frames(actor, (OUTER, INNER))
+  assert switches(driver) == [('frame', ('outer element',)), ('frame', ('inner element',))]
+  assert browsing_context(actor).frames == (OUTER, INNER)
+
+
+def test_enter_frames_skips_switching_to_the_current_frame(framed):
+  actor, driver = framed
+  enter_frames(actor, (OUTER, INNER))
+  driver.switch_to.reset_mock()
+  enter_frames(actor, (OUTER, INNER))
+  assert switches(driver) == []
+
+
+def test_enter_frames_goes_up_to_the_parent_frame(framed):
+  actor, driver = framed
+  enter_frames(actor, (OUTER, INNER))
+  driver.switch_to.reset_mock()
+  enter_frames(actor, (OUTER,))
+  assert switches(driver) == [('parent_frame', ())]
+
+
+def test_enter_frames_goes_deeper_without_starting_over(framed):
+  actor, driver = framed
+  enter_frames(actor, (OUTER,))
+  driver.switch_to.reset_mock()
+  enter_frames(actor, (OUTER, INNER))
+  assert switches(driver) == [('frame', ('inner element',))]
+
+
+def test_enter_frames_starts_over_for_another_branch(framed):
+  actor, driver = framed
+  enter_frames(actor, (OUTER, INNER))
+  driver.switch_to.reset_mock()
+  enter_frames(actor, (SIDE,))
+  assert switches(driver) == [('default_content', ()), ('frame', ('side element',))]
+
+
+def test_lookup_reenters_stale_frames(framed):
+  actor, driver = framed
+  enter_frames(actor, (OUTER, INNER))
+  driver.switch_to.reset_mock()
+
+  # the frames were re-rendered, so the driver is left in a discarded frame
+  misses = iter([StaleElementReferenceException('stale frame')])
+  def find_element(qtype, query):
+    if query == 'go':
+      for miss in misses:
+        raise miss
+    return f'{query} element'
+  driver.find_element.side_effect = find_element
+
+  assert actor.asks_for(ExistenceOf(BUTTON))
+  assert switches(driver) == [
+    ('default_content', ()), ('frame', ('outer element',)), ('frame', ('inner element',))]
+
+
+def test_polled_miss_inside_frames_costs_one_command(framed):
+  actor, driver = framed
+  enter_frames(actor, (OUTER, INNER))
+  driver.reset_mock()
+  driver.find_element.side_effect = NoSuchElementException('missing')
+
+  for _ in range(3):
+    assert not actor.asks_for(ExistenceOf(BUTTON))
+  assert driver.find_element.call_count == 3
+  assert switches(driver) == []
+
+
+def test_lookup_after_a_refresh_reenters_frames(framed):
+  actor, driver = framed
+  enter_frames(actor, (OUTER, INNER))
+  actor.attempts_to(RefreshBrowser())
+  driver.switch_to.reset_mock()
+  assert actor.asks_for(ExistenceOf(BUTTON))
+  assert switches(driver) == [('frame', ('outer element',)), ('frame', ('inner element',))]
+
+
+def test_lookup_outside_frames_does_not_retry_a_miss(framed):
+  actor, driver = framed
+  driver.find_element.side_effect = NoSuchElementException('missing')
+  assert not actor.asks_for(ExistenceOf(Locator('button', 'id', 'go')))
+  assert driver.find_element.call_count == 1
+
+
+def test_page_questions_run_in_the_top_level_document(framed):
+  actor, driver = framed
+  enter_frames(actor, (OUTER,))
+  driver.switch_to.reset_mock()
+  driver.execute_script.return_value = 'complete'
+  assert actor.asks_for(DocumentReadyState()) == 'complete'
+  assert switches(driver) == [('parent_frame', ())]
+  assert browsing_context(actor).frames == ()
+
+
+# --------------------------------------------------------------------------------
+# Tests for Profiling Script Lookups
+# --------------------------------------------------------------------------------
+
+@pytest.fixture
+def profiled(mocker):
+  driver = mocker.Mock()
+  actor = Actor()
+  actor.can_use(webdriver=driver, locator_profiler=LocatorProfiler())
+  return actor, driver
+
+
+def test_polled_count_is_profiled(profiled):
+  actor, driver = profiled
+  driver.execute_script.side_effect = [0, 1, 2]
+  actor.attempts_to(WaitUntil(CountOf(ITEMS), IsEqualTo(2), timeout=1))
+  rows = actor.using('locator_profiler').most_polled()
+  assert [(r['name'], r['qtype'], r['query'], r['polls']) for r in rows] == [('items', 'css selector', 'li', 3)]
+
+
+def test_appearance_of_all_is_profiled_for_each_locator(profiled):
+  actor, driver = profiled
+  driver.execute_script.return_value = True
+  first, second = Locator('first', 'id', 'a'), Locator('second', 'id', 'b')
+  assert actor.asks_for(AppearanceOfAll(first, second))
+  report = actor.using('locator_profiler').report()
+  assert sorted(r['name'] for r in report) == ['first', 'second']
+
+
+# --------------------------------------------------------------------------------
+# Tests for Fallback Strategies
+# --------------------------------------------------------------------------------
+
+SAVE = Locator('save', 'id', 'save', fallbacks=[('name', 'save'), ('xpath', '//button[1]')])
+PAGE = 'http://localhost/form'
+
+
+@pytest.fixture
+def fallback(mocker):
+  driver = mocker.Mock()
+  url = mocker.PropertyMock(return_value=PAGE)
+  type(driver).current_url = url
+  found = {('xpath', '//button[1]'): 'button'}
+  def find_element(qtype, query):
+    if (qtype, query) not in found:
+      raise NoSuchElementException(query)
+    return found[(qtype, query)]
+  driver.find_element.side_effect = find_element
+  driver.find_elements.side_effect = lambda qtype, query: [found[(qtype, query)]] if (qtype, query) in found else []
+  actor = Actor()
+  actor.can_use(webdriver=driver)
+  return actor, driver, url
+
+
+def tried(driver, method='find_element'):
+  return [c[0] for c in getattr(driver, method).call_args_list]
+
+
+def test_lookup_falls_back_to_the_next_strategy(fallback):
+  actor, driver, _ = fallback
+  assert LocatorInteraction(SAVE).find_element(actor) == 'button'
+  assert tried(driver) == [('id', 'save'), ('name', 'save'), ('xpath', '//button[1]')]
+
+
+def test_lookup_of_many_falls_back_after_no_matches(fallback):
+  actor, driver, _ = fallback
+  assert LocatorInteraction(SAVE).find_elements(actor) == ['button']
+  assert tried(driver, 'find_elements') == [('id', 'save'), ('name', 'save'), ('xpath', '//button[1]')]
+
+
+def test_lookup_raises_the_last_miss_when_every_strategy_fails(fallback):
+  actor, driver, _ = fallback
+  with pytest.raises(NoSuchElementException):
+    LocatorInteraction(Locator('save', 'id', 'save', fallbacks=[('name', 'save')])).find_element(actor)
+  assert len(tried(driver)) == 2
+
+
+def test_lookup_tries_cached_strategies_first(fallback, tmp_path):
+  actor, driver, _ = fallback
+  cache = LocatorCache(str(tmp_path / 'locators.json'))
+  actor.can_use(locator_cache=cache)
+  LocatorInteraction(SAVE).find_element(actor)
+  driver.find_element.reset_mock()
+
+  assert LocatorInteraction(SAVE).find_element(actor) == 'button'
+  assert tried(driver) == [('xpath', '//button[1]')]
+  assert cache.order(PAGE, SAVE)[0] == ('xpath', '//button[1]')
+
+
+def test_lookup_reads_the_page_url_once_per_wait(fallback, tmp_path):
+  actor, driver, url = fallback
+  actor.can_use(locator_cache=LocatorCache(str(tmp_path / 'locators.json')))
+  missing = Locator('missing', 'id', 'missing', fallbacks=[('name', 'missing')])
+  with pytest.raises(Exception):
+    actor.attempts_to(WaitUntil(ExistenceOf(missing), IsTrue(), timeout=0.05))
+  assert driver.find_element.call_count > 2
+  assert url.call_count == 1
+
+
+# --------------------------------------------------------------------------------
+# Tests for Alerts
+# --------------------------------------------------------------------------------
+
+@pytest.fixture
+def alerting(mocker):
+  driver = mocker.Mock()
+  driver.switch_to.alert.text = 'Are you sure?'
+  actor = Actor()
+  actor.can_use(webdriver=driver)
+  return actor, driver
+
+
+def test_accept_alert(alerting):
+  actor, driver = alerting
+  actor.attempts_to(AcceptAlert())
+  driver.switch_to.alert.accept.assert_called_once_with()
+
+
+def test_dismiss_alert(alerting):
+  actor, driver = alerting
+  actor.attempts_to(DismissAlert())
+  driver.switch_to.alert.dismiss.assert_called_once_with()
+
+
+def test_alert_text(alerting):
+  actor, _ = alerting
+  assert actor.asks_for(AlertText()) == 'Are you sure?'
+
+
+def test_alert_presence(alerting, mocker):
+  actor, driver = alerting
+  assert actor.asks_for(AlertPresence())
+  type(driver.switch_to).alert = mocker.PropertyMock(side_effect=NoAlertPresentException())
+  assert not actor.asks_for(AlertPresence())
+
+
+@pytest.mark.parametrize('policy', ['accept', 'dismiss'])
+def test_alert_policy_handles_unexpected_alerts_and_retries(alerting, policy):
+  actor, driver = alerting
+  actor.can_use(alert_policy=policy)
+  driver.execute_script.side_effect = [UnexpectedAlertPresentException(), 'complete']
+  assert actor.asks_for(DocumentReadyState()) == 'complete'
+  getattr(driver.switch_to.alert, policy).assert_called_once_with()
+
+
+def test_alert_policy_covers_page_readiness(alerting):
+  actor, driver = alerting
+  actor.can_use(alert_policy='accept')
+  driver.execute_script.side_effect = [UnexpectedAlertPresentException(), {'readyState': 'complete'}]
+  assert actor.asks_for(PageReadiness()) == {'readyState': 'complete'}
+
+
+def test_unexpected_alerts_raise_without_a_policy(alerting):
+  actor, driver = alerting
+  driver.execute_script.side_effect = UnexpectedAlertPresentException()
+  with pytest.raises(UnexpectedAlertPresentException):
+    actor.asks_for(DocumentReadyState())
+  driver.switch_to.alert.accept.assert_not_called()
+
+
+def test_alert_policy_rejects_unknown_policies(alerting):
+  actor, driver = alerting
+  actor.can_use(alert_policy='acept')
+  driver.execute_script.side_effect = [UnexpectedAlertPresentException(), 'complete']
+  with pytest.raises(ScreenplayException):
+    actor.asks_for(DocumentReadyState())
+  driver.switch_to.alert.accept.assert_not_called()
+  driver.switch_to.alert.dismiss.assert_not_called()
+
+
+def test_alert_policy_tolerates_alerts_closed_by_the_browser(alerting, mocker):
+  actor, driver = alerting
+  actor.can_use(alert_policy='accept')
+  type(driver.switch_to).alert = mocker.PropertyMock(side_effect=NoAlertPresentException())
+  driver.execute_script.side_effect = [UnexpectedAlertPresentException(), 'complete']
+  assert actor.asks_for(DocumentReadyState()) == 'complete'
+
+
+# --------------------------------------------------------------------------------
+# Tests for FillForm
+# --------------------------------------------------------------------------------
+
+EMAIL = Locator('email', 'id', 'email')
+PASSWORD = Locator('password', 'id', 'password')
+CARD = Locator('card number', 'name', 'card', frame=OUTER)
+
+
+def scripts(driver, script):
+  return [c[0][1:] for c in driver.execute_script.call_args_list if c[0][0] == script]
+
+
+def test_fill_form_sets_values_in_one_script(mocker):
+  driver = mocker.Mock()
+  driver.execute_script.return_value = True
+  actor = Actor()
+  actor.can_use(webdriver=driver)
+  actor.attempts_to(FillForm({EMAIL: 'me@example.com', PASSWORD: 1234}))
+  assert scripts(driver, SET_FIELD_VALUES_JS) == [
+    ([[EMAIL.strategies, 'me@example.com'], [PASSWORD.strategies, '1234']],)]
+
+
+def test_fill_form_types_values_with_the_keyboard(mocker):
+  driver = mocker.Mock(spec=Backend)
+  driver.execute_script.side_effect = lambda script, *args: ['email field', 'password field'] \
+    if script == SET_FIELD_VALUES_JS else True
+  actor = Actor()
+  actor.can_use(webdriver=driver)
+  actor.attempts_to(FillForm({EMAIL: 'me@example.com', PASSWORD: 1234}, keyboard=True))
+  assert scripts(driver, SET_FIELD_VALUES_JS) == [([[EMAIL.strategies, ''], [PASSWORD.strategies, '']],)]
+  driver.type_into.assert_called_once()
+  assert list(driver.type_into.call_args[0][0]) == [('email field', 'me@example.com'), ('password field', '1234')]
+
+
+def test_fill_form_fills_fields_frame_by_frame(framed):
+  actor, driver = framed
+  driver.execute_script.return_value = True
+  actor.attempts_to(FillForm({EMAIL: 'me@example.com', CARD: '4242'}))
+  assert scripts(driver, ALL_APPEARED_JS) == [([EMAIL.strategies],), ([CARD.strategies],)]
+  assert scripts(driver, SET_FIELD_VALUES_JS) == [
+    ([[EMAIL.strategies, 'me@example.com']],), ([[CARD.strategies, '4242']],)]
+  assert switches(driver) == [
+    ('frame', ('outer element',)), ('parent_frame', ()), ('frame', ('outer element',))]
+
+
+def test_appearance_of_all_stops_at_the_first_frame_with_missing_elements(framed):
+  actor, driver = framed
+  driver.execute_script.return_value = False
+  assert not actor.asks_for(AppearanceOfAll(EMAIL, CARD))
+  assert driver.execute_script.call_count == 1
+
+
+# --------------------------------------------------------------------------------
+# Tests for Counting and Existence
+# --------------------------------------------------------------------------------
+
+def test_find_all_script_supports_every_selenium_locator_type():
+  qtypes = [v for k, v in vars(By).items() if k.isupper()]
+  assert qtypes
+  for qtype in qtypes:
+    assert f"case '{qtype}':" in FIND_ALL_JS
+
+
+def test_count_of_uses_one_script_with_every_strategy(fallback):
+  actor, driver, _ = fallback
+  driver.execute_script.return_value = 3
+  assert actor.asks_for(CountOf(SAVE)) == 3
+  driver.execute_script.assert_called_once_with(COUNT_FIRST_MATCHING_JS, SAVE.strategies)
+  driver.find_elements.assert_not_called()
+
+
+def test_count_of_orders_strategies_from_the_cache(fallback, tmp_path):
+  actor, driver, _ = fallback
+  cache = LocatorCache(str(tmp_path / 'locators.json'))
+  cache.record_success(PAGE, SAVE, ('xpath', '//button[1]'), 0.01)
+  actor.can_use(locator_cache=cache)
+  driver.execute_script.return_value = 1
+  actor.asks_for(CountOf(SAVE))
+  strategies = driver.execute_script.call_args[0][1]
+  assert strategies[0] == ('xpath', '//button[1]')
+  assert sorted(strategies) == sorted(SAVE.strategies)
+
+
+def test_existence_of_a_found_element(fallback):
+  actor, _, _ = fallback
+  assert actor.asks_for(ExistenceOf(Locator('button', 'xpath', '//button[1]')))
+
+
+def test_existence_of_a_missing_element(fallback):
+  actor, driver, _ = fallback
+  assert not actor.asks_for(ExistenceOf(Locator('button', 'id', 'missing')))
+  assert tried(driver) == [('id', 'missing')]
+
+
+# --------------------------------------------------------------------------------
+# Tests for Windows
+# --------------------------------------------------------------------------------
+
+class Windows:
+
+  def __init__(self, *handles):
+    self.handles = list(handles)
+
+  def open(self, handle):
+    self.handles.append(handle)
+
+
+@pytest.fixture
+def windowed(mocker):
+  windows = Windows('main')
+  driver = mocker.Mock()
+  type(driver).window_handles = mocker.PropertyMock(side_effect=lambda: list(windows.handles))
+  driver.current_window_handle = 'main'
+  actor = Actor()
+  actor.can_use(webdriver=driver)
+  return actor, driver, windows
+
+
+def test_switch_to_window_skips_a_redundant_switch(windowed):
+  actor, driver, _ = windowed
+  actor.attempts_to(SwitchToWindow('main'))
+  actor.attempts_to(SwitchToWindow('main'))
+  driver.switch_to.window.assert_called_once_with('main')
+
+
+def test_switch_to_window_by_index(windowed):
+  actor, driver, windows = windowed
+  windows.open('popup')
+  assert actor.attempts_to(SwitchToWindow(1)) == 'popup'
+  driver.switch_to.window.assert_called_once_with('popup')
+
+
+def test_close_window_switches_to_the_first_remaining_window(windowed):
+  actor, driver, windows = windowed
+  windows.open('popup')
+  actor.attempts_to(SwitchToWindow(1))
+  driver.close.side_effect = lambda: windows.handles.remove('popup')
+  actor.attempts_to(CloseWindow())
+  assert driver.switch_to.window.call_args_list[-1][0] == ('main',)
+  assert actor.asks_for(WindowHandles()) == ['main']
+
+
+def test_wait_for_new_window_switches_to_it(windowed, mocker):
+  actor, driver, windows = windowed
+  actor.asks_for(WindowHandles())
+  windows.open('popup')
+  assert actor.attempts_to(WaitForNewWindow(timeout=1)) == 'popup'
+  driver.switch_to.window.assert_called_once_with('popup')
+
+
+def test_new_tab_ignores_windows_opened_after_the_handles_were_cached(windowed):
+  actor, driver, windows = windowed
+  actor.asks_for(WindowHandles())
+  windows.open('popup')
+  driver.execute_script.side_effect = lambda script, url: windows.open('tab')
+  assert actor.attempts_to(NewTab()) == 'tab'
+  driver.switch_to.window.assert_called_once_with('tab')
+
+
+# --------------------------------------------------------------------------------
+# Tests for Clicking and Scrolling
+# --------------------------------------------------------------------------------
+
+GO = Locator('go', 'id', 'go')
+LIST = Locator('list', 'id', 'list')
+
+
+@pytest.fixture
+def clickable(mocker):
+  element = mocker.Mock()
+  element.is_displayed.return_value = True
+  driver = mocker.Mock(spec=Backend)
+  driver.find_element.return_value = element
+  actor = Actor()
+  actor.can_use(webdriver=driver)
+  return actor, driver, element
+
+
+def test_fast_click_clicks_the_element_directly(clickable):
+  actor, driver, element = clickable
+  actor.attempts_to(Click(GO, fast=True))
+  element.click.assert_called_once_with()
+  driver.execute_script.assert_not_called()
+  driver.pointer_click.assert_not_called()
+
+
+def test_fast_click_scrolls_and_clicks_with_the_pointer_when_intercepted(clickable):
+  actor, driver, element = clickable
+  element.click.side_effect = ElementClickInterceptedException('covered')
+  actor.attempts_to(Click(GO, fast=True))
+  assert scripts(driver, SCROLL_INTO_VIEW_JS) == [(element,)]
+  assert driver.execute_script.call_count == 1
+  driver.pointer_click.assert_called_once_with(element)
+
+
+def test_click_uses_the_pointer(clickable):
+  actor, driver, element = clickable
+  actor.attempts_to(Click(GO))
+  element.click.assert_not_called()
+  driver.pointer_click.assert_called_once_with(element)
+
+
+def test_scroll_to_end_of_the_page(clickable):
+  actor, driver, _ = clickable
+  driver.execute_script.return_value = 2400
+  assert actor.attempts_to(ScrollToEnd()) == 2400
+  assert scripts(driver, SCROLL_TO_END_JS) == [(None,)]
+  driver.find_element.assert_not_called()
+
+
+def test_scroll_to_end_of_a_container(clickable):
+  actor, driver, element = clickable
+  driver.execute_script.return_value = 800
+  assert actor.attempts_to(ScrollToEnd(LIST)) == 800
+  assert scripts(driver, SCROLL_TO_END_JS) == [(element,)]
+
+
+# --------------------------------------------------------------------------------
+# Tests for Page Readiness
+# --------------------------------------------------------------------------------
+
+def readiness(state='complete', pending=0, idle=1.0):
+  return {'readyState': state, 'pendingRequests': pending, 'idleTime': idle}
+
+
+@pytest.fixture
+def loading(mocker):
+  driver = mocker.Mock(spec=Backend)
+  actor = Actor()
+  actor.can_use(webdriver=driver)
+  return actor, driver
+
+
+@pytest.mark.parametrize('answer, idle', [
+  (readiness(), True),
+  (readiness(state='interactive'), False),
+  (readiness(pending=2), False),
+  (readiness(idle=0.2), False),
+])
+def test_page_is_idle_only_when_every_condition_holds(loading, answer, idle):
+  actor, driver = loading
+  driver.execute_script.return_value = answer
+  assert actor.asks_for(PageIsIdle(quiet=0.5)) is idle
+  assert scripts(driver, PAGE_READINESS_JS) == [()]
+
+
+def test_wait_until_page_is_idle_polls_until_every_condition_holds(loading):
+  actor, driver = loading
+  driver.execute_script.side_effect = [
+    readiness(state='loading', pending=3, idle=0),
+    readiness(pending=1, idle=0),
+    readiness(idle=0.1),
+    readiness(idle=0.6),
+  ]
+  actor.attempts_to(WaitUntilPageIsIdle(quiet=0.5, timeout=5, interval=0.01))
+  assert driver.execute_script.call_count == 4
+
+
+def test_wait_until_document_ready_polls_the_ready_state(loading):
+  actor, driver = loading
+  driver.execute_script.side_effect = ['loading', 'interactive', 'complete']
+  actor.attempts_to(WaitUntilDocumentReady(timeout=5, interval=0.01))
+  assert driver.execute_script.call_count == 3
+
+
+# --------------------------------------------------------------------------------
+# Tests for NavigateToUrl
+# --------------------------------------------------------------------------------
+
+def metrics(load=1.5):
+  return {'url': 'https://example.com/', 'ttfb': 0.2, 'domContentLoaded': 0.9, 'load': load,
+    'resourceCount': 0, 'slowestResources': []}
+
+
+def test_navigate_to_url_records_page_load_metrics(loading):
+  actor, driver = loading
+  actor.can_use(instrumentation=Instrumentation())
+  driver.execute_script.return_value = metrics()
+  assert actor.attempts_to(NavigateToUrl('https://example.com/', measure=True)) == metrics()
+  driver.get.assert_called_once_with('https://example.com/')
+  assert scripts(driver, PAGE_LOAD_METRICS_JS) == [(10,)]
+  measurements = actor.using('instrumentation').summary()['measurements']
+  assert set(measurements) == {'page ttfb', 'page domContentLoaded', 'page load'}
+
+
+def test_navigate_to_url_skips_page_load_metrics_that_have_not_happened(loading):
+  actor, driver = loading
+  actor.can_use(instrumentation=Instrumentation())
+  driver.execute_script.return_value = metrics(load=0)
+  actor.attempts_to(NavigateToUrl('https://example.com/', measure=True))
+  measurements = actor.using('instrumentation').summary()['measurements']
+  assert set(measurements) == {'page ttfb', 'page domContentLoaded'}
+
+
+def test_navigate_to_url_measures_only_when_asked(loading):
+  actor, driver = loading
+  assert actor.attempts_to(NavigateToUrl('https://example.com/')) is None
+  driver.execute_script.assert_not_called()
+
+
+# --------------------------------------------------------------------------------
+# Tests for Browser State
+# --------------------------------------------------------------------------------
+
+ORIGIN = 'https://example.com'
+
+
+def browser_state(*cookies):
+  return {'origin': ORIGIN, 'localStorage': {'theme': 'dark'}, 'sessionStorage': {}, 'cookies': list(cookies)}
+
+
+@pytest.fixture
+def restoring(mocker):
+  driver = mocker.Mock()
+  driver.current_url = f'{ORIGIN}/account'
+  actor = Actor()
+  actor.can_use(webdriver=driver)
+  return actor, driver
+
+
+def test_restore_browser_state_stays_on_the_same_origin(restoring):
+  actor, driver = restoring
+  actor.attempts_to(RestoreBrowserState(browser_state()))
+  driver.get.assert_not_called()
+  assert scripts(driver, RESTORE_STORAGE_JS) == [(browser_state(),)]
+
+
+def test_restore_browser_state_navigates_to_a_different_origin(restoring):
+  actor, driver = restoring
+  driver.current_url = 'about:blank'
+  actor.attempts_to(RestoreBrowserState(browser_state()))
+  driver.get.assert_called_once_with(ORIGIN)
+
+
+def test_restore_browser_state_skips_expired_cookies(restoring):
+  actor, driver = restoring
+  session = {'name': 'session', 'value': '1'}
+  fresh = {'name': 'token', 'value': '2', 'expiry': int(time.time()) + 3600}
+  expired = {'name': 'old', 'value': '3', 'expiry': int(time.time()) - 3600}
+  actor.attempts_to(RestoreBrowserState(browser_state(session, fresh, expired)))
+  assert [c[0][0] for c in driver.add_cookie.call_args_list] == [session, fresh]
+
+
+def test_restore_browser_state_from_an_empty_cache(restoring, tmp_path):
+  actor, driver = restoring
+  actor.can_use(browser_state_cache=ExpiringJsonFileCache(str(tmp_path / 'state.json')))
+  assert actor.attempts_to(RestoreBrowserStateFrom('admin')) is False
+  driver.add_cookie.assert_not_called()
+  driver.execute_script.assert_not_called()
+
+
+def test_restore_browser_state_from_the_cache(restoring, tmp_path):
+  actor, driver = restoring
+  cache = ExpiringJsonFileCache(str(tmp_path / 'state.json'))
+  cache.store('admin', browser_state())
+  actor.can_use(browser_state_cache=cache)
+  assert actor.attempts_to(RestoreBrowserStateFrom('admin', max_age=60)) is True
+  assert scripts(driver, RESTORE_STORAGE_JS) == [(browser_state(),)]